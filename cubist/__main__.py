@@ -0,0 +1,139 @@
+"""
+Cubist - 3×3 Rubik's Cube Solver & Tutor
+Main application entry point (``python -m cubist`` or the ``cubist`` script).
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QIcon
+
+
+# (module name, pip package name) pairs checked at startup
+REQUIRED_PACKAGES = [
+    ("PySide6", "PySide6"),
+    ("numpy", "numpy"),
+    ("kociemba", "kociemba"),
+    ("reportlab", "reportlab"),
+    ("OpenGL", "PyOpenGL"),
+]
+
+
+def show_splash_screen(app: QApplication) -> QSplashScreen:
+    """Show splash screen during startup."""
+    # Use the pre-rendered splash image (text baked in) when available
+    splash_path = Path(__file__).parent / "assets" / "splash.png"
+    if splash_path.exists():
+        splash = QSplashScreen(QPixmap(str(splash_path)))
+    else:
+        splash_pixmap = QPixmap(400, 300)
+        splash_pixmap.fill(Qt.white)
+        splash = QSplashScreen(splash_pixmap)
+        splash.showMessage(
+            "Cubist - 3×3 Rubik's Cube Solver & Tutor\n\nLoading...",
+            Qt.AlignCenter | Qt.AlignBottom,
+            Qt.black
+        )
+    
+    splash.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.SplashScreen)
+    splash.show()
+    app.processEvents()
+    
+    return splash
+
+
+def check_dependencies() -> bool:
+    """Check if all required dependencies are available."""
+    missing_deps = []
+    
+    # Only locate the packages; importing them here would pay their full
+    # initialization cost (OpenGL.GL in particular sets up all GL bindings)
+    for module_name, package_name in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(module_name) is None:
+            missing_deps.append(package_name)
+    
+    if missing_deps:
+        QMessageBox.critical(
+            None,
+            "Missing Dependencies",
+            "The following required packages are missing:\n\n" +
+            "\n".join(f"• {dep}" for dep in missing_deps) +
+            "\n\nPlease install them using:\n" +
+            f"pip install {' '.join(missing_deps)}"
+        )
+        return False
+    
+    return True
+
+
+def setup_application() -> QApplication:
+    """Set up the QApplication with proper settings."""
+    # Enable high DPI scaling
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    
+    app = QApplication(sys.argv)
+    
+    # Set application properties
+    app.setApplicationName("Cubist")
+    app.setApplicationVersion("1.0.0")
+    app.setOrganizationName("Cubist Development Team")
+    app.setApplicationDisplayName("Cubist - 3×3 Rubik's Cube Solver & Tutor")
+    
+    # Set application icon (if available)
+    icon_path = Path(__file__).parent / "assets" / "icons" / "app.ico"
+    if icon_path.exists():
+        app.setWindowIcon(QIcon(str(icon_path)))
+    
+    return app
+
+
+def main() -> int:
+    """Main application entry point."""
+    try:
+        # Create application
+        app = setup_application()
+        
+        # Check dependencies
+        if not check_dependencies():
+            return 1
+        
+        # Show splash screen
+        splash = show_splash_screen(app)
+        
+        # Import the UI only now, so missing dependencies are reported above
+        # and the splash is already painted while the widget tree loads
+        from .ui.main_window import MainWindow
+        
+        # Create main window
+        main_window = MainWindow()
+        
+        # Hand over to the main window as soon as it is ready; finish()
+        # waits for the window to be shown before closing the splash
+        main_window.show()
+        main_window.raise_()
+        main_window.activateWindow()
+        splash.finish(main_window)
+        
+        # Run application
+        return app.exec()
+        
+    except Exception as e:
+        # Handle any startup errors
+        error_msg = f"Failed to start Cubist:\n\n{str(e)}"
+        
+        try:
+            QMessageBox.critical(None, "Startup Error", error_msg)
+        except:
+            # If Qt is not available, print to console
+            print(f"ERROR: {error_msg}")
+        
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
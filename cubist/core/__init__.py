@@ -1,18 +1,50 @@
 """
 Core module for Cubist - fundamental cube representations and operations.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+e.g. ColorScheme does not pull in NumPy and the cube state machinery.
 """
 
-from .cube_state import CubeState
-from .moves import Move, MoveSequence
-from .color_scheme import ColorScheme
-from .validators import validate_facelets
-from .scramble import generate_scramble
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .cube_state import CubeState
+    from .moves import Move, MoveSequence
+    from .color_scheme import ColorScheme
+    from .validators import validate_facelets
+    from .scramble import generate_scramble
+
+# Public name -> submodule that defines it
+_SUBMODULE_ATTRS = {
+    "CubeState": "cube_state",
+    "Move": "moves",
+    "MoveSequence": "moves",
+    "ColorScheme": "color_scheme",
+    "validate_facelets": "validators",
+    "generate_scramble": "scramble",
+}
 
 __all__ = [
     "CubeState",
-    "Move", 
+    "Move",
     "MoveSequence",
     "ColorScheme",
     "validate_facelets",
     "generate_scramble",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing `name` on first access."""
+    if name not in _SUBMODULE_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_SUBMODULE_ATTRS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List public names, including those not yet imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,10 +2,17 @@
 Color scheme management for Rubik's Cube visualization.
 """
 
+import re
 from typing import Dict, Tuple
 from dataclasses import dataclass
 
 
+# Face letters in to_dict() order
+_FACES = ('U', 'D', 'F', 'B', 'R', 'L')
+
+_HEX_COLOR_MATCH = re.compile(r'#[0-9A-Fa-f]{6}').fullmatch
+
+
 @dataclass
 class ColorScheme:
     """Color scheme for cube faces with hex color values."""
@@ -19,32 +26,42 @@ class ColorScheme:
     L: str = "#FF5800"  # Left - Orange
     
     def __post_init__(self) -> None:
-        """Validate hex color format."""
-        for face, color in self.to_dict().items():
-            if not self._is_valid_hex(color):
+        """Validate hex color format and precompute RGB values."""
+        for face in _FACES:
+            color = getattr(self, face)
+            if not _HEX_COLOR_MATCH(color):
                 raise ValueError(f"Invalid hex color for face {face}: {color}")
+        self._build_cache()
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set an attribute, validating and refreshing the cached RGB values for face colors."""
+        refresh = name in _FACES and '_rgb' in self.__dict__
+        if refresh and not _HEX_COLOR_MATCH(value):
+            raise ValueError(f"Invalid hex color for face {name}: {value}")
+        super().__setattr__(name, value)
+        if refresh:
+            self._build_cache()
+    
+    def _build_cache(self) -> None:
+        """Precompute the face/color pairs and RGB tuples used by the getters."""
+        items = tuple((face, getattr(self, face)) for face in _FACES)
+        rgb = {}
+        rgb_normalized = {}
+        for face, color in items:
+            value = int(color[1:], 16)
+            r, g, b = value >> 16, (value >> 8) & 0xFF, value & 0xFF
+            rgb[face] = (r, g, b)
+            rgb_normalized[face] = (r / 255.0, g / 255.0, b / 255.0)
+        self.__dict__.update(_items=items, _rgb=rgb, _rgb_normalized=rgb_normalized)
     
     @staticmethod
     def _is_valid_hex(color: str) -> bool:
         """Check if string is valid hex color."""
-        if not color.startswith('#') or len(color) != 7:
-            return False
-        try:
-            int(color[1:], 16)
-            return True
-        except ValueError:
-            return False
+        return _HEX_COLOR_MATCH(color) is not None
     
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary mapping."""
-        return {
-            'U': self.U,
-            'D': self.D, 
-            'F': self.F,
-            'B': self.B,
-            'R': self.R,
-            'L': self.L
-        }
+        return dict(self._items)
     
     @classmethod
     def from_dict(cls, colors: Dict[str, str]) -> "ColorScheme":
@@ -60,14 +77,11 @@ class ColorScheme:
     
     def get_rgb(self, face: str) -> Tuple[int, int, int]:
         """Get RGB values (0-255) for a face."""
-        hex_color = self.to_dict()[face]
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return self._rgb[face]
     
     def get_rgb_normalized(self, face: str) -> Tuple[float, float, float]:
         """Get normalized RGB values (0.0-1.0) for OpenGL."""
-        r, g, b = self.get_rgb(face)
-        return (r / 255.0, g / 255.0, b / 255.0)
+        return self._rgb_normalized[face]
     
     def copy(self) -> "ColorScheme":
         """Create a copy of this color scheme."""
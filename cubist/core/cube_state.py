@@ -2,13 +2,222 @@
 Cube state representation using cubie-based model with facelet conversion.
 """
 
-from typing import List, Tuple, Optional, Dict
-import numpy as np
-from dataclasses import dataclass
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, List, Tuple, Optional, Dict
 from .color_scheme import ColorScheme
+from .moves import Move, move_codes
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Face order used by the facelet layout: U, R, F, D, L, B
+_CENTER_POSITIONS = (4, 13, 22, 31, 40, 49)
+
+# Corner positions: (face1, pos1, face2, pos2, face3, pos3)
+_CORNER_FACELETS = (
+    (0, 0, 1, 0, 2, 2),  # URF
+    (0, 2, 2, 0, 4, 2),  # UFL
+    (0, 8, 4, 0, 5, 2),  # ULB
+    (0, 6, 5, 0, 1, 2),  # UBR
+    (3, 2, 2, 8, 1, 6),  # DFR
+    (3, 0, 4, 8, 2, 6),  # DLF
+    (3, 6, 5, 8, 4, 6),  # DBL
+    (3, 8, 1, 8, 5, 6),  # DRB
+)
+
+# Edge positions: (face1, pos1, face2, pos2)
+_EDGE_FACELETS = (
+    (0, 1, 1, 1),  # UR
+    (0, 5, 2, 1),  # UF
+    (0, 7, 4, 1),  # UL
+    (0, 3, 5, 1),  # UB
+    (3, 1, 1, 7),  # DR
+    (3, 5, 2, 7),  # DF
+    (3, 7, 4, 7),  # DL
+    (3, 3, 5, 7),  # DB
+    (2, 5, 1, 3),  # FR
+    (2, 3, 4, 5),  # FL
+    (5, 5, 4, 3),  # BL
+    (5, 3, 1, 5),  # BR
+)
+
+# Face triple/pair seen in a slot -> (cubie, orientation), for every twist/flip
+_CORNER_LOOKUP: Dict[Tuple[int, ...], Tuple[int, int]] = {
+    tuple(faces[(k - orient) % 3] for k in range(3)): (corner, orient)
+    for corner, faces in enumerate(facelets[0::2] for facelets in _CORNER_FACELETS)
+    for orient in range(3)
+}
+_EDGE_LOOKUP: Dict[Tuple[int, ...], Tuple[int, int]] = {
+    tuple(faces[k ^ orient] for k in range(2)): (edge, orient)
+    for edge, faces in enumerate(facelets[0::2] for facelets in _EDGE_FACELETS)
+    for orient in range(2)
+}
+
+
+# Layout of the 40-byte state buffer: corner_perm, corner_orient, edge_perm, edge_orient
+_CP = slice(0, 8)
+_CO = slice(8, 16)
+_EP = slice(16, 28)
+_EO = slice(28, 40)
+
+# Exclusive upper bound of the values stored at each buffer position
+_VALUE_LIMITS = (8,) * 8 + (3,) * 8 + (12,) * 12 + (2,) * 12
+
+# Raw int8 bytes of the solved buffer, compared against buf.tobytes()
+_SOLVED_BYTES = bytes(range(8)) + bytes(8) + bytes(range(12)) + bytes(12)
+
+# bytes.translate table from face index bytes (0-5) to face letters
+_FACE_LETTER_TABLE = bytes.maketrans(bytes(range(6)), b"URFDLB")
+
+
+# Quarter-turn definitions of the six faces in "replaced by" form: after the
+# turn, slot i holds the cubie previously in slot perm[i], with its
+# orientation increased by delta[i] (mod 3 for corners, mod 2 for edges).
+_FACE_TURNS = {
+    'U': ([3, 0, 1, 2, 4, 5, 6, 7], [0, 0, 0, 0, 0, 0, 0, 0],
+          [3, 0, 1, 2, 4, 5, 6, 7, 8, 9, 10, 11], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
+    'R': ([4, 1, 2, 0, 7, 5, 6, 3], [2, 0, 0, 1, 1, 0, 0, 2],
+          [8, 1, 2, 3, 11, 5, 6, 7, 4, 9, 10, 0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
+    'F': ([1, 5, 2, 3, 0, 4, 6, 7], [1, 2, 0, 0, 2, 1, 0, 0],
+          [0, 9, 2, 3, 4, 8, 6, 7, 1, 5, 10, 11], [0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0]),
+    'D': ([0, 1, 2, 3, 5, 6, 7, 4], [0, 0, 0, 0, 0, 0, 0, 0],
+          [0, 1, 2, 3, 5, 6, 7, 4, 8, 9, 10, 11], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
+    'L': ([0, 2, 6, 3, 4, 1, 5, 7], [0, 1, 2, 0, 0, 2, 1, 0],
+          [0, 1, 10, 3, 4, 5, 9, 7, 8, 2, 6, 11], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
+    'B': ([0, 1, 3, 7, 4, 5, 2, 6], [0, 0, 1, 2, 0, 0, 2, 1],
+          [0, 1, 2, 11, 4, 5, 6, 10, 8, 9, 3, 7], [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 1]),
+}
+
+
+def _compose(first: Tuple[np.ndarray, ...], second: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+    """Compose two move tables: the result applies `first`, then `second`."""
+    cp1, co1, ep1, eo1 = first
+    cp2, co2, ep2, eo2 = second
+    return (cp1[cp2], (co1[cp2] + co2) % 3, ep1[ep2], eo1[ep2] ^ eo2)
+
+
+def _build_move_tables() -> Dict[Move, Tuple[np.ndarray, ...]]:
+    """Build (corner_perm, corner_delta, edge_perm, edge_delta) for every move."""
+    tables = {}
+    for face, (cp, co, ep, eo) in _FACE_TURNS.items():
+        quarter = (np.array(cp, dtype=np.intp), np.array(co, dtype=np.int8),
+                   np.array(ep, dtype=np.intp), np.array(eo, dtype=np.int8))
+        half = _compose(quarter, quarter)
+        prime = _compose(half, quarter)
+        
+        # Wide moves are treated as their face turn (simplified implementation)
+        for letter in (face, face.lower()):
+            tables[Move.from_string(letter)] = quarter
+            tables[Move.from_string(letter + "'")] = prime
+            tables[Move.from_string(letter + "2")] = half
+    return tables
+
+
+def _build_apply_functions(
+    buffer_tables: Dict[Move, Tuple[np.ndarray, np.ndarray]], moduli: np.ndarray
+) -> Dict[Move, Callable[["CubeState"], "CubeState"]]:
+    """
+    Generate a specialized apply function for every move.
+    
+    Each function has its move's tables bound as globals, and the delta/modulus
+    steps are only emitted when the move changes an orientation (half turns and
+    U/D turns are a pure gather).
+    """
+    functions = {}
+    for move, (perm, delta) in buffer_tables.items():
+        name = f"_apply_{move.name}"
+        namespace = {"_from_buffer": CubeState._from_buffer, "_PERM": perm,
+                     "_DELTA": delta, "_MODULI": moduli}
+        lines = [f"def {name}(state):", "    buf = state._buf[_PERM]"]
+        if delta.any():
+            lines += ["    buf += _DELTA", "    buf %= _MODULI"]
+        lines.append("    return _from_buffer(buf)")
+        exec("\n".join(lines), namespace)
+        functions[move] = namespace[name]
+    return functions
+
+
+# Row of each move in the stacked move tables passed to the _kernels functions
+# (the same as its Move.code)
+_MOVE_ROWS: Dict[Move, int] = {move: row for row, move in enumerate(Move)}
+
+
+# NumPy-backed tables, built by _init_tables() when the first CubeState is
+# created so that importing this module does not import NumPy.
+_MOVE_TABLES: Optional[Dict[Move, Tuple[np.ndarray, ...]]] = None
+_STACKED_TABLES: Optional[Tuple[np.ndarray, ...]] = None
+_APPLY_FUNCTIONS: Optional[Dict[Move, Callable[["CubeState"], "CubeState"]]] = None
+_BUFFER_TABLES: Optional[Dict[Move, Tuple[np.ndarray, np.ndarray]]] = None
+_BUFFER_MODULI: Optional[np.ndarray] = None
+
+
+def _init_tables() -> None:
+    """Import NumPy and build the array lookup tables."""
+    global np, _CENTER_INDEX, _CORNER_FACELET_IDX, _EDGE_FACELET_IDX
+    global _CORNER_FACES, _EDGE_FACES, _STICKER_INDEX_3, _STICKER_INDEX_2
+    global _MOVE_TABLES, _STACKED_TABLES, _APPLY_FUNCTIONS, _kernels
+    global _BUFFER_TABLES, _BUFFER_MODULI
+    import numpy as np
+    from . import _kernels
+    
+    _CENTER_INDEX = np.array(_CENTER_POSITIONS, dtype=np.int8)
+    
+    # Facelet indices (0-53) of each cubie slot's stickers
+    _CORNER_FACELET_IDX = np.array(
+        [[f1*9 + p1, f2*9 + p2, f3*9 + p3] for f1, p1, f2, p2, f3, p3 in _CORNER_FACELETS],
+        dtype=np.int8,
+    )
+    _EDGE_FACELET_IDX = np.array(
+        [[f1*9 + p1, f2*9 + p2] for f1, p1, f2, p2 in _EDGE_FACELETS],
+        dtype=np.int8,
+    )
+    
+    # Faces (0-5) showing on each solved cubie's stickers
+    _CORNER_FACES = np.array([facelets[0::2] for facelets in _CORNER_FACELETS], dtype=np.int8)
+    _EDGE_FACES = np.array([facelets[0::2] for facelets in _EDGE_FACELETS], dtype=np.int8)
+    
+    _STICKER_INDEX_3 = np.arange(3, dtype=np.int8)
+    _STICKER_INDEX_2 = np.arange(2, dtype=np.int8)
+    
+    _MOVE_TABLES = _build_move_tables()
+    
+    # The same tables over the whole state buffer: new_buf = (buf[perm] + delta) % moduli.
+    # Orientation entries gather from their own slice; permutation entries get
+    # a zero delta and a modulus larger than any cubie index.
+    _BUFFER_TABLES = {
+        move: (np.concatenate([cp, cp + 8, ep + 16, ep + 28]),
+               np.concatenate([np.zeros(8, dtype=np.int8), co, np.zeros(12, dtype=np.int8), eo]))
+        for move, (cp, co, ep, eo) in _MOVE_TABLES.items()
+    }
+    _BUFFER_MODULI = np.array([127] * 8 + [3] * 8 + [127] * 12 + [2] * 12, dtype=np.int8)
+    _APPLY_FUNCTIONS = _build_apply_functions(_BUFFER_TABLES, _BUFFER_MODULI)
+    
+    # (perms, deltas, moduli) with one row per move, for the _kernels functions
+    _STACKED_TABLES = (
+        np.stack([_BUFFER_TABLES[move][0] for move in _MOVE_ROWS]),
+        np.stack([_BUFFER_TABLES[move][1] for move in _MOVE_ROWS]),
+        _BUFFER_MODULI,
+    )
+
+
+def buffer_move_tables() -> Tuple[Dict[Move, Tuple[np.ndarray, np.ndarray]], np.ndarray]:
+    """
+    Return the tables that apply each move to a 40-byte state buffer.
+    
+    A move maps buf to (buf[perm] + delta) % moduli, which is what
+    CubeState.apply_move does; searches use the tables to work on raw
+    buffers (see CubeState.buffer) without building CubeStates.
+    
+    Returns:
+        Tuple of ({move: (perm, delta)}, moduli)
+    """
+    if _BUFFER_TABLES is None:
+        _init_tables()
+    return _BUFFER_TABLES, _BUFFER_MODULI
 
 
-@dataclass
 class CubeState:
     """
     Cubie-based representation of a 3x3 Rubik's Cube state.
@@ -18,23 +227,88 @@ class CubeState:
     - corner_orient[8]: orientation of each corner (0, 1, 2)
     - edge_perm[12]: permutation of 12 edges (0-11)  
     - edge_orient[12]: orientation of each edge (0, 1)
+    
+    All four arrays are views into one contiguous 40-byte int8 buffer, so
+    copying, hashing and comparing a state touches a single array.
     """
     
-    corner_perm: np.ndarray
-    corner_orient: np.ndarray
-    edge_perm: np.ndarray
-    edge_orient: np.ndarray
+    __slots__ = ("_buf",)
     
     def __init__(self, 
                  corner_perm: Optional[List[int]] = None,
                  corner_orient: Optional[List[int]] = None,
                  edge_perm: Optional[List[int]] = None,
                  edge_orient: Optional[List[int]] = None) -> None:
-        """Initialize cube state with optional arrays."""
-        self.corner_perm = np.array(corner_perm if corner_perm else list(range(8)), dtype=np.int8)
-        self.corner_orient = np.array(corner_orient if corner_orient else [0] * 8, dtype=np.int8)
-        self.edge_perm = np.array(edge_perm if edge_perm else list(range(12)), dtype=np.int8)
-        self.edge_orient = np.array(edge_orient if edge_orient else [0] * 12, dtype=np.int8)
+        """
+        Initialize cube state with optional arrays.
+        
+        Raises:
+            ValueError: If an array has the wrong length or a value is out of range
+        """
+        if _MOVE_TABLES is None:
+            _init_tables()
+        buf = np.frombuffer(_SOLVED_BYTES, dtype=np.int8).copy()
+        for name, part, values in (("corner_perm", _CP, corner_perm),
+                                   ("corner_orient", _CO, corner_orient),
+                                   ("edge_perm", _EP, edge_perm),
+                                   ("edge_orient", _EO, edge_orient)):
+            if values is None:
+                continue
+            size = part.stop - part.start
+            if len(values) != size:
+                raise ValueError(f"{name} must have {size} elements, got {len(values)}")
+            if min(values) < 0 or max(values) >= _VALUE_LIMITS[part.start]:
+                raise ValueError(f"{name} values must be in range 0-{_VALUE_LIMITS[part.start] - 1}")
+            buf[part] = values
+        self._buf = buf
+    
+    @staticmethod
+    def _from_buffer(buf: np.ndarray) -> "CubeState":
+        """Wrap an existing 40-byte state buffer without copying or validation."""
+        state = CubeState.__new__(CubeState)
+        state._buf = buf
+        return state
+    
+    @property
+    def buffer(self) -> np.ndarray:
+        """The 40-byte state buffer: corner_perm, corner_orient, edge_perm, edge_orient."""
+        return self._buf
+    
+    @property
+    def corner_perm(self) -> np.ndarray:
+        """Permutation of the 8 corners (view into the state buffer)."""
+        return self._buf[_CP]
+    
+    @corner_perm.setter
+    def corner_perm(self, value: List[int]) -> None:
+        self._buf[_CP] = value
+    
+    @property
+    def corner_orient(self) -> np.ndarray:
+        """Orientation of the 8 corners (view into the state buffer)."""
+        return self._buf[_CO]
+    
+    @corner_orient.setter
+    def corner_orient(self, value: List[int]) -> None:
+        self._buf[_CO] = value
+    
+    @property
+    def edge_perm(self) -> np.ndarray:
+        """Permutation of the 12 edges (view into the state buffer)."""
+        return self._buf[_EP]
+    
+    @edge_perm.setter
+    def edge_perm(self, value: List[int]) -> None:
+        self._buf[_EP] = value
+    
+    @property
+    def edge_orient(self) -> np.ndarray:
+        """Orientation of the 12 edges (view into the state buffer)."""
+        return self._buf[_EO]
+    
+    @edge_orient.setter
+    def edge_orient(self, value: List[int]) -> None:
+        self._buf[_EO] = value
     
     @staticmethod
     def solved() -> "CubeState":
@@ -43,37 +317,94 @@ class CubeState:
     
     def clone(self) -> "CubeState":
         """Create a deep copy of this cube state."""
-        return CubeState(
-            corner_perm=self.corner_perm.copy(),
-            corner_orient=self.corner_orient.copy(),
-            edge_perm=self.edge_perm.copy(),
-            edge_orient=self.edge_orient.copy()
-        )
+        return CubeState._from_buffer(self._buf.copy())
     
     def is_solved(self) -> bool:
         """Check if the cube is in solved state."""
-        return (np.array_equal(self.corner_perm, np.arange(8)) and
-                np.array_equal(self.corner_orient, np.zeros(8)) and
-                np.array_equal(self.edge_perm, np.arange(12)) and
-                np.array_equal(self.edge_orient, np.zeros(12)))
+        return self._buf.tobytes() == _SOLVED_BYTES
     
     def __eq__(self, other: object) -> bool:
         """Check equality with another CubeState."""
         if not isinstance(other, CubeState):
             return False
-        return (np.array_equal(self.corner_perm, other.corner_perm) and
-                np.array_equal(self.corner_orient, other.corner_orient) and
-                np.array_equal(self.edge_perm, other.edge_perm) and
-                np.array_equal(self.edge_orient, other.edge_orient))
+        return self._buf.tobytes() == other._buf.tobytes()
     
     def __hash__(self) -> int:
         """Hash for use in sets and dictionaries."""
-        return hash((
-            tuple(self.corner_perm),
-            tuple(self.corner_orient),
-            tuple(self.edge_perm),
-            tuple(self.edge_orient)
-        ))
+        return hash(self._buf.tobytes())
+    
+    def to_bytes(self) -> bytes:
+        """Return the raw state buffer, a cheap exact key for sets and dictionaries."""
+        return self._buf.tobytes()
+    
+    @staticmethod
+    def from_bytes(data: bytes) -> "CubeState":
+        """
+        Restore a cube state from the bytes produced by to_bytes().
+        
+        Args:
+            data: 40 raw state bytes
+            
+        Returns:
+            CubeState object
+            
+        Raises:
+            ValueError: If data is not 40 bytes long
+        """
+        if len(data) != len(_SOLVED_BYTES):
+            raise ValueError(f"Expected {len(_SOLVED_BYTES)} state bytes, got {len(data)}")
+        if _MOVE_TABLES is None:
+            _init_tables()
+        return CubeState._from_buffer(np.frombuffer(data, dtype=np.int8).copy())
+    
+    def __repr__(self) -> str:
+        """Return a readable representation of the four arrays."""
+        return (f"CubeState(corner_perm={self.corner_perm.tolist()}, "
+                f"corner_orient={self.corner_orient.tolist()}, "
+                f"edge_perm={self.edge_perm.tolist()}, "
+                f"edge_orient={self.edge_orient.tolist()})")
+    
+    def pack(self) -> int:
+        """
+        Pack the state into a single 100-bit integer.
+        
+        Layout (least significant first): corner_perm (8 x 3 bits),
+        corner_orient (8 x 2 bits), edge_perm (12 x 4 bits) and
+        edge_orient (12 x 1 bit).
+        
+        Returns:
+            Packed integer, suitable as a compact dictionary key
+        """
+        packed = 0
+        for value in self.edge_orient.tolist():
+            packed = packed << 1 | value
+        for value in self.edge_perm.tolist():
+            packed = packed << 4 | value
+        for value in self.corner_orient.tolist():
+            packed = packed << 2 | value
+        for value in self.corner_perm.tolist():
+            packed = packed << 3 | value
+        return packed
+    
+    @staticmethod
+    def from_packed(packed: int) -> "CubeState":
+        """
+        Restore a cube state from the integer produced by pack().
+        
+        Args:
+            packed: Packed state integer
+            
+        Returns:
+            CubeState object
+        """
+        corner_perm = [(packed >> (3 * (7 - i))) & 0x7 for i in range(8)]
+        packed >>= 24
+        corner_orient = [(packed >> (2 * (7 - i))) & 0x3 for i in range(8)]
+        packed >>= 16
+        edge_perm = [(packed >> (4 * (11 - i))) & 0xF for i in range(12)]
+        packed >>= 48
+        edge_orient = [(packed >> (11 - i)) & 0x1 for i in range(12)]
+        return CubeState(corner_perm, corner_orient, edge_perm, edge_orient)
     
     @staticmethod
     def from_facelets(facelets: List[str]) -> "CubeState":
@@ -89,100 +420,30 @@ class CubeState:
         """
         if len(facelets) != 54:
             raise ValueError(f"Expected 54 facelets, got {len(facelets)}")
+        if _MOVE_TABLES is None:
+            _init_tables()
         
-        # Define facelet to cubie mappings
-        # Corner positions: (face1, pos1, face2, pos2, face3, pos3)
-        corner_facelets = [
-            (0, 0, 1, 0, 2, 2),  # URF
-            (0, 2, 2, 0, 4, 2),  # UFL  
-            (0, 8, 4, 0, 5, 2),  # ULB
-            (0, 6, 5, 0, 1, 2),  # UBR
-            (3, 2, 2, 8, 1, 6),  # DFR
-            (3, 0, 4, 8, 2, 6),  # DLF
-            (3, 6, 5, 8, 4, 6),  # DBL
-            (3, 8, 1, 8, 5, 6),  # DRB
-        ]
+        # Map each sticker color to the face whose center carries it
+        face_of_color = {facelets[pos]: face for face, pos in enumerate(_CENTER_POSITIONS)}
+        faces = np.array([face_of_color.get(color, -1) for color in facelets], dtype=np.int8)
         
-        # Edge positions: (face1, pos1, face2, pos2)
-        edge_facelets = [
-            (0, 1, 1, 1),  # UR
-            (0, 5, 2, 1),  # UF
-            (0, 7, 4, 1),  # UL
-            (0, 3, 5, 1),  # UB
-            (3, 1, 1, 7),  # DR
-            (3, 5, 2, 7),  # DF
-            (3, 7, 4, 7),  # DL
-            (3, 3, 5, 7),  # DB
-            (2, 5, 1, 3),  # FR
-            (2, 3, 4, 5),  # FL
-            (4, 3, 5, 5),  # BL
-            (5, 3, 1, 5),  # BR
-        ]
-        
-        # Get center colors to determine face mapping
-        centers = [facelets[4], facelets[13], facelets[22], facelets[31], facelets[40], facelets[49]]
-        
-        # Find corner permutations and orientations
+        # Gather the face triples/pairs of every cubie slot in one indexing op
         corner_perm = []
         corner_orient = []
-        
-        for i, (f1, p1, f2, p2, f3, p3) in enumerate(corner_facelets):
-            # Get the three colors of this corner
-            colors = [facelets[f1*9 + p1], facelets[f2*9 + p2], facelets[f3*9 + p3]]
-            
-            # Find which solved corner this matches
-            solved_corner = -1
-            orientation = 0
-            
-            for j, (sf1, sp1, sf2, sp2, sf3, sp3) in enumerate(corner_facelets):
-                solved_colors = [centers[sf1], centers[sf2], centers[sf3]]
-                
-                # Check all three orientations
-                for orient in range(3):
-                    rotated_colors = [colors[(k + orient) % 3] for k in range(3)]
-                    if rotated_colors == solved_colors:
-                        solved_corner = j
-                        orientation = orient
-                        break
-                
-                if solved_corner != -1:
-                    break
-            
-            if solved_corner == -1:
+        for i, key in enumerate(map(tuple, faces[_CORNER_FACELET_IDX].tolist())):
+            if key not in _CORNER_LOOKUP:
                 raise ValueError(f"Invalid corner at position {i}")
-            
-            corner_perm.append(solved_corner)
+            corner, orientation = _CORNER_LOOKUP[key]
+            corner_perm.append(corner)
             corner_orient.append(orientation)
         
-        # Find edge permutations and orientations
         edge_perm = []
         edge_orient = []
-        
-        for i, (f1, p1, f2, p2) in enumerate(edge_facelets):
-            # Get the two colors of this edge
-            colors = [facelets[f1*9 + p1], facelets[f2*9 + p2]]
-            
-            # Find which solved edge this matches
-            solved_edge = -1
-            orientation = 0
-            
-            for j, (sf1, sp1, sf2, sp2) in enumerate(edge_facelets):
-                solved_colors = [centers[sf1], centers[sf2]]
-                
-                # Check both orientations
-                if colors == solved_colors:
-                    solved_edge = j
-                    orientation = 0
-                    break
-                elif colors == [solved_colors[1], solved_colors[0]]:
-                    solved_edge = j
-                    orientation = 1
-                    break
-            
-            if solved_edge == -1:
+        for i, key in enumerate(map(tuple, faces[_EDGE_FACELET_IDX].tolist())):
+            if key not in _EDGE_LOOKUP:
                 raise ValueError(f"Invalid edge at position {i}")
-            
-            edge_perm.append(solved_edge)
+            edge, orientation = _EDGE_LOOKUP[key]
+            edge_perm.append(edge)
             edge_orient.append(orientation)
         
         return CubeState(corner_perm, corner_orient, edge_perm, edge_orient)
@@ -197,234 +458,67 @@ class CubeState:
         Returns:
             List of 54 facelet colors
         """
-        # Initialize with center colors
-        facelets = [''] * 54
-        centers = ['U', 'R', 'F', 'D', 'L', 'B']
-        center_positions = [4, 13, 22, 31, 40, 49]
+        scheme_colors = (scheme.U, scheme.R, scheme.F, scheme.D, scheme.L, scheme.B)
+        return [scheme_colors[face] for face in self._facelet_faces().tolist()]
+    
+    def to_face_string(self) -> str:
+        """
+        Convert to a 54-character string of face letters (URFDLB order).
         
-        for i, center in enumerate(centers):
-            facelets[center_positions[i]] = getattr(scheme, center)
+        This is the facelet format used by the Kociemba solver: each sticker
+        is named by the face whose center has its color.
         
-        # Corner facelet mappings (same as in from_facelets)
-        corner_facelets = [
-            (0, 0, 1, 0, 2, 2),  # URF
-            (0, 2, 2, 0, 4, 2),  # UFL  
-            (0, 8, 4, 0, 5, 2),  # ULB
-            (0, 6, 5, 0, 1, 2),  # UBR
-            (3, 2, 2, 8, 1, 6),  # DFR
-            (3, 0, 4, 8, 2, 6),  # DLF
-            (3, 6, 5, 8, 4, 6),  # DBL
-            (3, 8, 1, 8, 5, 6),  # DRB
-        ]
+        Returns:
+            String of U, R, F, D, L and B letters
+        """
+        return self._facelet_faces().tobytes().translate(_FACE_LETTER_TABLE).decode('ascii')
+    
+    def _facelet_faces(self) -> np.ndarray:
+        """Return the face index (0-5, URFDLB order) showing on each of the 54 facelets."""
+        faces = np.empty(54, dtype=np.int8)
+        faces[_CENTER_INDEX] = np.arange(6)
         
-        # Edge facelet mappings
-        edge_facelets = [
-            (0, 1, 1, 1),  # UR
-            (0, 5, 2, 1),  # UF
-            (0, 7, 4, 1),  # UL
-            (0, 3, 5, 1),  # UB
-            (3, 1, 1, 7),  # DR
-            (3, 5, 2, 7),  # DF
-            (3, 7, 4, 7),  # DL
-            (3, 3, 5, 7),  # DB
-            (2, 5, 1, 3),  # FR
-            (2, 3, 4, 5),  # FL
-            (4, 3, 5, 5),  # BL
-            (5, 3, 1, 5),  # BR
-        ]
+        # Corner stickers: rotate the solved face triple by the orientation
+        corner_shift = (_STICKER_INDEX_3 - self.corner_orient[:, None]) % 3
+        faces[_CORNER_FACELET_IDX] = _CORNER_FACES[self.corner_perm[:, None], corner_shift]
         
-        # Fill corner facelets
-        for i in range(8):
-            corner_pos = self.corner_perm[i]
-            orientation = self.corner_orient[i]
-            
-            # Get solved corner colors
-            sf1, sp1, sf2, sp2, sf3, sp3 = corner_facelets[corner_pos]
-            solved_colors = [getattr(scheme, centers[sf1]), 
-                           getattr(scheme, centers[sf2]), 
-                           getattr(scheme, centers[sf3])]
-            
-            # Apply orientation
-            oriented_colors = [solved_colors[(j - orientation) % 3] for j in range(3)]
-            
-            # Set facelet colors
-            f1, p1, f2, p2, f3, p3 = corner_facelets[i]
-            facelets[f1*9 + p1] = oriented_colors[0]
-            facelets[f2*9 + p2] = oriented_colors[1]
-            facelets[f3*9 + p3] = oriented_colors[2]
+        # Edge stickers: swap the solved face pair when flipped
+        edge_shift = _STICKER_INDEX_2 ^ self.edge_orient[:, None]
+        faces[_EDGE_FACELET_IDX] = _EDGE_FACES[self.edge_perm[:, None], edge_shift]
         
-        # Fill edge facelets
-        for i in range(12):
-            edge_pos = self.edge_perm[i]
-            orientation = self.edge_orient[i]
-            
-            # Get solved edge colors
-            sf1, sp1, sf2, sp2 = edge_facelets[edge_pos]
-            solved_colors = [getattr(scheme, centers[sf1]), 
-                           getattr(scheme, centers[sf2])]
-            
-            # Apply orientation
-            if orientation == 1:
-                solved_colors = [solved_colors[1], solved_colors[0]]
-            
-            # Set facelet colors
-            f1, p1, f2, p2 = edge_facelets[i]
-            facelets[f1*9 + p1] = solved_colors[0]
-            facelets[f2*9 + p2] = solved_colors[1]
-        
-        return facelets
+        return faces
     
-    def apply_move(self, move: "Move") -> "CubeState":
+    def apply_move(self, move: Move) -> "CubeState":
         """Apply a move to this state and return the new state."""
-        from .moves import Move
-        
-        # Move transformation tables
-        # Each move defines how corners and edges are permuted and oriented
-        
-        # R move transformations
-        if move == Move.R:
-            return self._apply_r_move()
-        elif move == Move.Rp:
-            return self._apply_r_move()._apply_r_move()._apply_r_move()
-        elif move == Move.R2:
-            return self._apply_r_move()._apply_r_move()
-        
-        # Similar for other moves...
-        # For brevity, implementing key moves first
-        elif move == Move.U:
-            return self._apply_u_move()
-        elif move == Move.Up:
-            return self._apply_u_move()._apply_u_move()._apply_u_move()
-        elif move == Move.U2:
-            return self._apply_u_move()._apply_u_move()
-        
-        elif move == Move.F:
-            return self._apply_f_move()
-        elif move == Move.Fp:
-            return self._apply_f_move()._apply_f_move()._apply_f_move()
-        elif move == Move.F2:
-            return self._apply_f_move()._apply_f_move()
-        
-        # Wide moves (for now, treat as regular moves - simplified implementation)
-        elif move == Move.r:
-            return self._apply_r_move()
-        elif move == Move.rp:
-            return self._apply_r_move()._apply_r_move()._apply_r_move()
-        elif move == Move.r2:
-            return self._apply_r_move()._apply_r_move()
-        elif move == Move.f:
-            return self._apply_f_move()
-        elif move == Move.fp:
-            return self._apply_f_move()._apply_f_move()._apply_f_move()
-        elif move == Move.f2:
-            return self._apply_f_move()._apply_f_move()
-        elif move == Move.u:
-            return self._apply_u_move()
-        elif move == Move.up:
-            return self._apply_u_move()._apply_u_move()._apply_u_move()
-        elif move == Move.u2:
-            return self._apply_u_move()._apply_u_move()
-        
-        # Add other moves as needed
-        else:
-            # For now, return copy for unimplemented moves
-            # TODO: Implement all remaining moves (L, D, B and their wide variants)
-            return self.clone()
-    
-    def _apply_r_move(self) -> "CubeState":
-        """Apply R move transformation."""
-        new_state = self.clone()
-        
-        # R move corner permutation cycle: 0->3->7->4->0
-        corner_cycle = [0, 3, 7, 4]
-        temp_perm = new_state.corner_perm[corner_cycle[0]]
-        temp_orient = new_state.corner_orient[corner_cycle[0]]
-        
-        for i in range(3):
-            new_state.corner_perm[corner_cycle[i]] = new_state.corner_perm[corner_cycle[i+1]]
-            new_state.corner_orient[corner_cycle[i]] = new_state.corner_orient[corner_cycle[i+1]]
-        
-        new_state.corner_perm[corner_cycle[3]] = temp_perm
-        new_state.corner_orient[corner_cycle[3]] = temp_orient
-        
-        # R move edge permutation cycle: 0->8->4->11->0
-        edge_cycle = [0, 8, 4, 11]
-        temp_perm = new_state.edge_perm[edge_cycle[0]]
-        temp_orient = new_state.edge_orient[edge_cycle[0]]
-        
-        for i in range(3):
-            new_state.edge_perm[edge_cycle[i]] = new_state.edge_perm[edge_cycle[i+1]]
-            new_state.edge_orient[edge_cycle[i]] = new_state.edge_orient[edge_cycle[i+1]]
-        
-        new_state.edge_perm[edge_cycle[3]] = temp_perm
-        new_state.edge_orient[edge_cycle[3]] = temp_orient
-        
-        return new_state
+        return _APPLY_FUNCTIONS[move](self)
     
-    def _apply_u_move(self) -> "CubeState":
-        """Apply U move transformation."""
-        new_state = self.clone()
-        
-        # U move corner permutation cycle: 0->1->2->3->0
-        corner_cycle = [0, 1, 2, 3]
-        temp_perm = new_state.corner_perm[corner_cycle[0]]
-        temp_orient = new_state.corner_orient[corner_cycle[0]]
-        
-        for i in range(3):
-            new_state.corner_perm[corner_cycle[i]] = new_state.corner_perm[corner_cycle[i+1]]
-            new_state.corner_orient[corner_cycle[i]] = new_state.corner_orient[corner_cycle[i+1]]
-        
-        new_state.corner_perm[corner_cycle[3]] = temp_perm
-        new_state.corner_orient[corner_cycle[3]] = temp_orient
-        
-        # U move edge permutation cycle: 0->1->2->3->0
-        edge_cycle = [0, 1, 2, 3]
-        temp_perm = new_state.edge_perm[edge_cycle[0]]
-        temp_orient = new_state.edge_orient[edge_cycle[0]]
-        
-        for i in range(3):
-            new_state.edge_perm[edge_cycle[i]] = new_state.edge_perm[edge_cycle[i+1]]
-            new_state.edge_orient[edge_cycle[i]] = new_state.edge_orient[edge_cycle[i+1]]
+    def apply_sequence(self, moves: Iterable[Move]) -> "CubeState":
+        """
+        Apply several moves in order and return the new state.
         
-        new_state.edge_perm[edge_cycle[3]] = temp_perm
-        new_state.edge_orient[edge_cycle[3]] = temp_orient
+        The whole sequence runs in a single kernel call (Numba-compiled when
+        available) instead of building an intermediate state per move.
         
-        return new_state
+        Args:
+            moves: Moves to apply
+            
+        Returns:
+            New CubeState after all moves
+        """
+        return self.apply_move_codes(move_codes(moves))
     
-    def _apply_f_move(self) -> "CubeState":
-        """Apply F move transformation."""
-        new_state = self.clone()
-        
-        # F move corner permutation cycle: 0->4->5->1->0
-        corner_cycle = [0, 4, 5, 1]
-        temp_perm = new_state.corner_perm[corner_cycle[0]]
-        temp_orient = new_state.corner_orient[corner_cycle[0]]
-        
-        for i in range(3):
-            new_state.corner_perm[corner_cycle[i]] = new_state.corner_perm[corner_cycle[i+1]]
-            # F move also changes corner orientation
-            new_state.corner_orient[corner_cycle[i]] = (new_state.corner_orient[corner_cycle[i+1]] + 1) % 3
-        
-        new_state.corner_perm[corner_cycle[3]] = temp_perm
-        new_state.corner_orient[corner_cycle[3]] = (temp_orient + 1) % 3
-        
-        # F move edge permutation cycle: 1->8->5->9->1
-        edge_cycle = [1, 8, 5, 9]
-        temp_perm = new_state.edge_perm[edge_cycle[0]]
-        temp_orient = new_state.edge_orient[edge_cycle[0]]
-        
-        for i in range(3):
-            new_state.edge_perm[edge_cycle[i]] = new_state.edge_perm[edge_cycle[i+1]]
-            # F move flips certain edges
-            if edge_cycle[i] in [1, 5]:  # UF and DF edges get flipped
-                new_state.edge_orient[edge_cycle[i]] = (new_state.edge_orient[edge_cycle[i+1]] + 1) % 2
-            else:
-                new_state.edge_orient[edge_cycle[i]] = new_state.edge_orient[edge_cycle[i+1]]
+    def apply_move_codes(self, codes: bytes) -> "CubeState":
+        """
+        Apply moves given by their codes, one byte per move, and return the new state.
         
-        new_state.edge_perm[edge_cycle[3]] = temp_perm
-        if edge_cycle[3] in [1, 5]:
-            new_state.edge_orient[edge_cycle[3]] = (temp_orient + 1) % 2
-        else:
-            new_state.edge_orient[edge_cycle[3]] = temp_orient
+        Callers that apply the same algorithm many times can encode it once,
+        with moves.move_codes(), and skip the per-move lookups.
         
-        return new_state
+        Args:
+            codes: Move codes to apply, in order
+            
+        Returns:
+            New CubeState after all moves
+        """
+        move_ids = np.frombuffer(codes, dtype=np.int8)
+        return CubeState._from_buffer(_kernels.apply_sequence(self._buf, move_ids, *_STACKED_TABLES))
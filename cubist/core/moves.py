@@ -3,8 +3,10 @@ Move definitions and operations for Rubik's Cube using Singmaster notation.
 """
 
 from enum import Enum, auto
-from typing import List, Optional
-import re
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, Optional, Tuple
 
 
 class Move(Enum):
@@ -62,41 +64,36 @@ class Move(Enum):
 
     def __str__(self) -> str:
         """String representation using standard notation."""
-        move_map = {
-            Move.R: "R", Move.Rp: "R'", Move.R2: "R2",
-            Move.L: "L", Move.Lp: "L'", Move.L2: "L2",
-            Move.U: "U", Move.Up: "U'", Move.U2: "U2",
-            Move.D: "D", Move.Dp: "D'", Move.D2: "D2",
-            Move.F: "F", Move.Fp: "F'", Move.F2: "F2",
-            Move.B: "B", Move.Bp: "B'", Move.B2: "B2",
-            # Wide moves
-            Move.r: "r", Move.rp: "r'", Move.r2: "r2",
-            Move.l: "l", Move.lp: "l'", Move.l2: "l2",
-            Move.u: "u", Move.up: "u'", Move.u2: "u2",
-            Move.d: "d", Move.dp: "d'", Move.d2: "d2",
-            Move.f: "f", Move.fp: "f'", Move.f2: "f2",
-            Move.b: "b", Move.bp: "b'", Move.b2: "b2",
-        }
-        return move_map[self]
+        return self._notation
+
+    @property
+    def notation(self) -> str:
+        """Standard notation of the move, e.g. "R'" or "u2"."""
+        return self._notation
+
+    @property
+    def code(self) -> int:
+        """Index of the move in declaration order (0-35)."""
+        return self._code
+
+    @property
+    def face(self) -> str:
+        """Face letter, lowercase for wide moves."""
+        return self._face
+
+    @property
+    def face_id(self) -> int:
+        """Index of the face in declaration order (0-5 outer faces, 6-11 wide turns)."""
+        return self._face_id
+
+    @property
+    def turn(self) -> int:
+        """Clockwise quarter turns: 1, -1 (prime) or 2."""
+        return self._turn
 
     def inverse(self) -> "Move":
         """Return the inverse of this move."""
-        inverse_map = {
-            Move.R: Move.Rp, Move.Rp: Move.R, Move.R2: Move.R2,
-            Move.L: Move.Lp, Move.Lp: Move.L, Move.L2: Move.L2,
-            Move.U: Move.Up, Move.Up: Move.U, Move.U2: Move.U2,
-            Move.D: Move.Dp, Move.Dp: Move.D, Move.D2: Move.D2,
-            Move.F: Move.Fp, Move.Fp: Move.F, Move.F2: Move.F2,
-            Move.B: Move.Bp, Move.Bp: Move.B, Move.B2: Move.B2,
-            # Wide moves
-            Move.r: Move.rp, Move.rp: Move.r, Move.r2: Move.r2,
-            Move.l: Move.lp, Move.lp: Move.l, Move.l2: Move.l2,
-            Move.u: Move.up, Move.up: Move.u, Move.u2: Move.u2,
-            Move.d: Move.dp, Move.dp: Move.d, Move.d2: Move.d2,
-            Move.f: Move.fp, Move.fp: Move.f, Move.f2: Move.f2,
-            Move.b: Move.bp, Move.bp: Move.b, Move.b2: Move.b2,
-        }
-        return inverse_map[self]
+        return _MOVE_INV[self.value - 1]
 
     def apply(self, state: "CubeState") -> "CubeState":
         """Apply this move to a cube state and return the new state."""
@@ -106,33 +103,73 @@ class Move(Enum):
     @staticmethod
     def from_string(move_str: str) -> "Move":
         """Parse a move from string notation."""
-        move_str = move_str.strip()
-        string_map = {
-            "R": Move.R, "R'": Move.Rp, "R2": Move.R2,
-            "L": Move.L, "L'": Move.Lp, "L2": Move.L2,
-            "U": Move.U, "U'": Move.Up, "U2": Move.U2,
-            "D": Move.D, "D'": Move.Dp, "D2": Move.D2,
-            "F": Move.F, "F'": Move.Fp, "F2": Move.F2,
-            "B": Move.B, "B'": Move.Bp, "B2": Move.B2,
-            # Wide moves
-            "r": Move.r, "r'": Move.rp, "r2": Move.r2,
-            "l": Move.l, "l'": Move.lp, "l2": Move.l2,
-            "u": Move.u, "u'": Move.up, "u2": Move.u2,
-            "d": Move.d, "d'": Move.dp, "d2": Move.d2,
-            "f": Move.f, "f'": Move.fp, "f2": Move.f2,
-            "b": Move.b, "b'": Move.bp, "b2": Move.b2,
-        }
-        if move_str not in string_map:
-            raise ValueError(f"Invalid move notation: {move_str}")
-        return string_map[move_str]
+        try:
+            return _STR_TO_MOVE[move_str.strip()]
+        except KeyError:
+            raise ValueError(f"Invalid move notation: {move_str.strip()}") from None
+
+
+# Notation of each move, indexed by move.value - 1 (Rp -> "R'", u2 -> "u2")
+_MOVE_STR = tuple(move.name.replace("p", "'") for move in Move)
+
+# Inverse of each move, indexed the same way: quarter turns swap with their
+# primes, half turns are their own inverse
+_MOVE_INV = tuple(
+    Move[move.name[0] + {"": "p", "p": "", "2": "2"}[move.name[1:]]] for move in Move
+)
+
+_STR_TO_MOVE = {notation: move for move, notation in zip(Move, _MOVE_STR)}
+
+# Cache the notation, code (0-35, in declaration order), face letter, face id
+# (0-11) and turn count (1, -1 or 2) on each member, so hot loops read an
+# attribute instead of formatting and scanning str(move)
+for _index, (_move, _notation) in enumerate(zip(Move, _MOVE_STR)):
+    _move._notation = _notation
+    _move._code = _index
+    _move._face = _notation[0]
+    _move._face_id = _index // 3
+    _move._turn = -1 if _notation.endswith("'") else (2 if _notation.endswith("2") else 1)
+del _index, _move, _notation
+
+_get_notation = attrgetter("_notation")
+
+
+def move_codes(moves: Iterable[Move]) -> bytes:
+    """Encode moves as their codes, one byte per move (see Move.code)."""
+    return bytes([move._code for move in moves])
+
+
+@lru_cache(maxsize=1024)
+def _parse_moves(move_string: str) -> Tuple[Move, ...]:
+    """Parse notation into a tuple of moves, caching repeated algorithm strings."""
+    # str.split() splits on any whitespace run and drops empty tokens
+    try:
+        return tuple([_STR_TO_MOVE[token] for token in move_string.split()])
+    except KeyError as e:
+        raise ValueError(f"Invalid move sequence: Invalid move notation: {e.args[0]}") from None
+
+
+# Move for each face id and clockwise quarter-turn count 0-3 (None for 0)
+_MOVE_BY_FACE_TURN = tuple(
+    (None, quarter, half, prime) for quarter, prime, half in zip(*[iter(Move)] * 3)
+)
+
+
+# Sequences at least this long are simplified with NumPy run-length sums
+_VECTORIZED_SIMPLIFY_MIN_LENGTH = 50
 
 
 class MoveSequence:
-    """A sequence of moves with parsing and manipulation capabilities."""
+    """
+    A sequence of moves with parsing and manipulation capabilities.
     
-    def __init__(self, moves: List[Move]) -> None:
-        """Initialize with a list of moves."""
-        self.moves = moves.copy()
+    Moves are stored in an immutable tuple, so sequences can share it
+    without defensive copies.
+    """
+    
+    def __init__(self, moves: Iterable[Move]) -> None:
+        """Initialize with a list (or any iterable) of moves."""
+        self.moves: Tuple[Move, ...] = moves if type(moves) is tuple else tuple(moves)
     
     def __len__(self) -> int:
         """Return the number of moves in the sequence."""
@@ -146,9 +183,15 @@ class MoveSequence:
         """Get move at index."""
         return self.moves[index]
     
+    def __add__(self, other: "MoveSequence") -> "MoveSequence":
+        """Return a new sequence with the moves of other appended."""
+        if not isinstance(other, MoveSequence):
+            return NotImplemented
+        return MoveSequence(self.moves + other.moves)
+    
     def __str__(self) -> str:
         """String representation of the move sequence."""
-        return " ".join(str(move) for move in self.moves)
+        return " ".join(map(_get_notation, self.moves))
     
     def __eq__(self, other: object) -> bool:
         """Check equality with another MoveSequence."""
@@ -159,20 +202,9 @@ class MoveSequence:
     @staticmethod
     def parse(move_string: str) -> "MoveSequence":
         """Parse a move sequence from string notation."""
-        if not move_string.strip():
-            return MoveSequence([])
-        
-        # Split by whitespace and filter empty strings
-        move_tokens = [token.strip() for token in re.split(r'\s+', move_string.strip()) if token.strip()]
-        
-        moves = []
-        for token in move_tokens:
-            try:
-                moves.append(Move.from_string(token))
-            except ValueError as e:
-                raise ValueError(f"Invalid move sequence: {e}")
-        
-        return MoveSequence(moves)
+        # Each call gets its own sequence; only the immutable tuple is shared,
+        # so append/extend on the result can't leak into the cache
+        return MoveSequence(_parse_moves(move_string))
     
     def to_str(self) -> str:
         """Convert to string representation."""
@@ -180,84 +212,48 @@ class MoveSequence:
     
     def inverse(self) -> "MoveSequence":
         """Return the inverse sequence (reversed with each move inverted)."""
-        return MoveSequence([move.inverse() for move in reversed(self.moves)])
+        return MoveSequence(tuple([_MOVE_INV[move._code] for move in self.moves[::-1]]))
     
     def simplify(self) -> "MoveSequence":
         """Simplify the sequence by combining consecutive moves of the same face."""
         if not self.moves:
             return MoveSequence([])
         
-        simplified = []
-        i = 0
+        # NumPy's fixed call overhead only pays off on longer sequences
+        if len(self.moves) < _VECTORIZED_SIMPLIFY_MIN_LENGTH:
+            simplified = []
+            for face_id, run in groupby(self.moves, key=attrgetter("_face_id")):
+                total = sum(move._turn for move in run) % 4
+                if total:
+                    simplified.append(_MOVE_BY_FACE_TURN[face_id][total])
+            return MoveSequence(simplified)
         
-        while i < len(self.moves):
-            current_move = self.moves[i]
-            face = self._get_face(current_move)
-            count = self._get_turn_count(current_move)
-            
-            # Look ahead for same face moves
-            j = i + 1
-            while j < len(self.moves) and self._get_face(self.moves[j]) == face:
-                count += self._get_turn_count(self.moves[j])
-                j += 1
-            
-            # Normalize count (0, 1, 2, 3 -> 0, 1, 2, 1 respectively)
-            count = count % 4
-            if count == 3:
-                count = -1  # Counter-clockwise
-            
-            # Add the simplified move if not identity
-            if count != 0:
-                simplified.append(self._create_move(face, count))
-            
-            i = j
+        import numpy as np
+        from . import _kernels
         
-        return MoveSequence(simplified)
-    
-    def _get_face(self, move: Move) -> str:
-        """Get the face letter from a move."""
-        move_str = str(move)
-        return move_str[0]
-    
-    def _get_turn_count(self, move: Move) -> int:
-        """Get the turn count from a move (1, -1, or 2)."""
-        move_str = str(move)
-        if "'" in move_str:
-            return -1
-        elif "2" in move_str:
-            return 2
-        else:
-            return 1
-    
-    def _create_move(self, face: str, count: int) -> Move:
-        """Create a move from face and turn count."""
-        if count == 1:
-            suffix = ""
-        elif count == -1:
-            suffix = "'"
-        elif count == 2:
-            suffix = "2"
-        else:
-            raise ValueError(f"Invalid turn count: {count}")
+        count = len(self.moves)
+        faces = np.fromiter((move._face_id for move in self.moves), dtype=np.int8, count=count)
+        turns = np.fromiter((move._turn for move in self.moves), dtype=np.intp, count=count)
+        
+        # Sum the turns of each run of same-face moves (1-3 quarter turns clockwise)
+        face_ids, totals = _kernels.simplify_runs(faces, turns)
+        simplified = [_MOVE_BY_FACE_TURN[face_id][total]
+                      for face_id, total in zip(face_ids.tolist(), totals.tolist())]
         
-        return Move.from_string(f"{face}{suffix}")
+        return MoveSequence(simplified)
     
     def append(self, move: Move) -> None:
-        """Append a move to the sequence."""
-        self.moves.append(move)
+        """Append a move to the sequence (rebuilds the tuple; prefer +)."""
+        self.moves += (move,)
     
     def extend(self, other: "MoveSequence") -> None:
-        """Extend with another sequence."""
-        self.moves.extend(other.moves)
+        """Extend with another sequence (rebuilds the tuple; prefer +)."""
+        self.moves += other.moves
     
     def copy(self) -> "MoveSequence":
-        """Return a copy of this sequence."""
+        """Return a copy of this sequence (the move tuple is shared)."""
         return MoveSequence(self.moves)
     
     def apply_to(self, state: "CubeState") -> "CubeState":
         """Apply this sequence to a cube state."""
-        from .cube_state import CubeState
-        current_state = state
-        for move in self.moves:
-            current_state = move.apply(current_state)
-        return current_state
+        return state.apply_sequence(self.moves)
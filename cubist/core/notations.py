@@ -3,8 +3,27 @@ Notation parsing, formatting, and manipulation utilities.
 """
 
 import re
-from typing import List, Optional, Dict
-from .moves import Move, MoveSequence
+from itertools import chain
+from typing import List, Optional, Dict, Sequence
+from .moves import Move, MoveSequence, move_codes
+
+
+# Face letter for each face id (outer faces, then wide turns)
+_FACE_LETTERS = tuple(move.face for move in Move)[::3]
+
+
+def encode_moves(moves: Sequence[Move]) -> str:
+    """Encode moves as a string with one character per move, for searching with str methods."""
+    return move_codes(moves).decode("latin-1")
+
+
+def _face_distribution(face_counts: List[int]) -> Dict[str, int]:
+    """Name per-face-id counts: all six outer faces, plus any wide turns used."""
+    distribution = dict(zip(_FACE_LETTERS[:6], face_counts[:6]))
+    for face, count in zip(_FACE_LETTERS[6:], face_counts[6:]):
+        if count:
+            distribution[face] = count
+    return distribution
 
 
 def parse_moves(notation: str) -> MoveSequence:
@@ -40,15 +59,15 @@ def format_moves(sequence: MoveSequence,
     if len(sequence) == 0:
         return ""
     
-    moves_str = str(sequence)
-    moves_list = moves_str.split()
+    moves_list = [move.notation for move in sequence.moves]
+    move_lengths = [len(move) for move in moves_list]
     
     lines = []
     current_line = []
     current_length = 0
     
-    for move in moves_list:
-        move_length = len(move) + (1 if current_line else 0)  # +1 for space
+    for move, length in zip(moves_list, move_lengths):
+        move_length = length + (1 if current_line else 0)  # +1 for space
         
         if (len(current_line) >= moves_per_line or 
             current_length + move_length > line_length):
@@ -118,25 +137,20 @@ def count_moves(sequence: MoveSequence) -> Dict[str, int]:
     Returns:
         Dictionary with move counts
     """
-    counts = {
+    # Tally by face id and count half turns, naming the faces at the end
+    face_counts = [0] * len(_FACE_LETTERS)
+    half_turns = 0
+    for move in sequence.moves:
+        face_counts[move.face_id] += 1
+        if move.turn == 2:
+            half_turns += 1
+    
+    return {
         'total': len(sequence),
-        'quarter_turns': 0,
-        'half_turns': 0,
-        'face_counts': {'R': 0, 'L': 0, 'U': 0, 'D': 0, 'F': 0, 'B': 0}
+        'quarter_turns': len(sequence) - half_turns,
+        'half_turns': half_turns,
+        'face_counts': _face_distribution(face_counts)
     }
-    
-    for move in sequence:
-        move_str = str(move)
-        face = move_str[0]
-        
-        counts['face_counts'][face] += 1
-        
-        if '2' in move_str:
-            counts['half_turns'] += 1
-        else:
-            counts['quarter_turns'] += 1
-    
-    return counts
 
 
 def extract_subsequence(sequence: MoveSequence, 
@@ -179,12 +193,16 @@ def find_patterns(sequence: MoveSequence, pattern: MoveSequence) -> List[int]:
     if len(pattern) == 0 or len(pattern) > len(sequence):
         return []
     
-    matches = []
-    pattern_moves = pattern.moves
+    # Search the one-character-per-move encodings with str.find, which skips
+    # ahead Boyer-Moore-Horspool style in C instead of comparing every window
+    text = encode_moves(sequence.moves)
+    needle = encode_moves(pattern.moves)
     
-    for i in range(len(sequence) - len(pattern) + 1):
-        if sequence.moves[i:i + len(pattern)] == pattern_moves:
-            matches.append(i)
+    matches = []
+    index = text.find(needle)
+    while index != -1:
+        matches.append(index)
+        index = text.find(needle, index + 1)
     
     return matches
 
@@ -206,22 +224,27 @@ def replace_pattern(sequence: MoveSequence,
     if len(pattern) == 0:
         return sequence.copy()
     
-    result_moves = []
-    i = 0
-    
-    while i < len(sequence):
-        # Check if pattern matches at current position
-        if (i + len(pattern) <= len(sequence) and 
-            sequence.moves[i:i + len(pattern)] == pattern.moves):
-            # Add replacement
-            result_moves.extend(replacement.moves)
-            i += len(pattern)
-        else:
-            # Add current move
-            result_moves.append(sequence.moves[i])
-            i += 1
+    # Find non-overlapping matches left to right, then splice the untouched
+    # slices and the replacement together
+    moves = sequence.moves
+    text = encode_moves(moves)
+    needle = encode_moves(pattern.moves)
+    size = len(pattern)
+    
+    chunks = []
+    start = 0
+    index = text.find(needle)
+    while index != -1:
+        chunks.append(moves[start:index])
+        chunks.append(replacement.moves)
+        start = index + size
+        index = text.find(needle, start)
+    
+    if not chunks:
+        return sequence.copy()
+    chunks.append(moves[start:])
     
-    return MoveSequence(result_moves)
+    return MoveSequence(tuple(chain.from_iterable(chunks)))
 
 
 def analyze_efficiency(sequence: MoveSequence) -> Dict[str, any]:
@@ -242,31 +265,50 @@ def analyze_efficiency(sequence: MoveSequence) -> Dict[str, any]:
             'suggestions': []
         }
     
-    simplified = sequence.simplify()
+    # One pass: tally moves per face and count the moves simplify() would
+    # keep by merging same-face runs as they end
+    total = len(sequence)
+    face_counts = [0] * len(_FACE_LETTERS)
+    simplified_moves = 0
+    run_face = -1
+    run_turns = 0
+    for move in sequence.moves:
+        face_id = move.face_id
+        face_counts[face_id] += 1
+        if face_id != run_face:
+            if run_turns % 4:
+                simplified_moves += 1
+            run_face = face_id
+            run_turns = 0
+        run_turns += move.turn
+    if run_turns % 4:
+        simplified_moves += 1
+    
+    distribution = _face_distribution(face_counts)
+    
     redundancies = []
     suggestions = []
     
     # Check for obvious redundancies
-    if len(simplified) < len(sequence):
-        redundancies.append(f"Can be simplified from {len(sequence)} to {len(simplified)} moves")
+    if simplified_moves < total:
+        redundancies.append(f"Can be simplified from {total} to {simplified_moves} moves")
         suggestions.append("Use sequence.simplify() to reduce move count")
     
     # Check for repeated patterns
-    move_counts = count_moves(sequence)
-    for face, count in move_counts['face_counts'].items():
-        if count > len(sequence) * 0.3:  # More than 30% of moves on one face
+    for face, count in distribution.items():
+        if count > total * 0.3:  # More than 30% of moves on one face
             suggestions.append(f"High frequency of {face} moves ({count}) - consider alternative algorithms")
     
     # Calculate efficiency score (lower is better)
-    efficiency_score = len(sequence) / max(1, len(simplified))
+    efficiency_score = total / max(1, simplified_moves)
     
     return {
-        'total_moves': len(sequence),
-        'simplified_moves': len(simplified),
+        'total_moves': total,
+        'simplified_moves': simplified_moves,
         'efficiency_score': efficiency_score,
         'redundancies': redundancies,
         'suggestions': suggestions,
-        'move_distribution': move_counts['face_counts']
+        'move_distribution': distribution
     }
 
 
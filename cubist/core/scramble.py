@@ -3,10 +3,50 @@ WCA-compliant scramble generation for 3x3 Rubik's Cube.
 """
 
 import random
-from typing import List
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
 from .moves import Move, MoveSequence
 
 
+# Define move groups to avoid consecutive moves on same face or opposite faces
+_MOVE_GROUPS = {
+    'R': (Move.R, Move.Rp, Move.R2),
+    'L': (Move.L, Move.Lp, Move.L2),
+    'U': (Move.U, Move.Up, Move.U2),
+    'D': (Move.D, Move.Dp, Move.D2),
+    'F': (Move.F, Move.Fp, Move.F2),
+    'B': (Move.B, Move.Bp, Move.B2)
+}
+
+# Opposite face pairs
+_OPPOSITE_FACES = {
+    'R': 'L', 'L': 'R',
+    'U': 'D', 'D': 'U',
+    'F': 'B', 'B': 'F'
+}
+
+
+def _build_valid_faces() -> Dict[Tuple[Optional[str], Optional[str]], Tuple[str, ...]]:
+    """Precompute the faces allowed after every (last_face, second_last_face) pair."""
+    valid_faces = {}
+    history = (None,) + tuple(_MOVE_GROUPS)
+    for last_face in history:
+        for second_last_face in history:
+            valid_faces[(last_face, second_last_face)] = tuple(
+                face for face in _MOVE_GROUPS
+                # Can't use same face as last move
+                if face != last_face
+                # Can't use opposite face if last two moves were on opposite faces
+                and not (second_last_face is not None and last_face is not None and
+                         face == second_last_face and
+                         _OPPOSITE_FACES.get(face) == last_face)
+            )
+    return valid_faces
+
+
+_VALID_FACES = _build_valid_faces()
+
+
 def generate_scramble(length: int = 25) -> MoveSequence:
     """
     Generate a WCA-compliant random scramble.
@@ -20,50 +60,19 @@ def generate_scramble(length: int = 25) -> MoveSequence:
     if length <= 0:
         return MoveSequence([])
     
-    # Define move groups to avoid consecutive moves on same face or opposite faces
-    move_groups = {
-        'R': [Move.R, Move.Rp, Move.R2],
-        'L': [Move.L, Move.Lp, Move.L2],
-        'U': [Move.U, Move.Up, Move.U2],
-        'D': [Move.D, Move.Dp, Move.D2],
-        'F': [Move.F, Move.Fp, Move.F2],
-        'B': [Move.B, Move.Bp, Move.B2]
-    }
-    
-    # Opposite face pairs
-    opposite_faces = {
-        'R': 'L', 'L': 'R',
-        'U': 'D', 'D': 'U', 
-        'F': 'B', 'B': 'F'
-    }
-    
-    faces = list(move_groups.keys())
     scramble_moves = []
     
     last_face = None
     second_last_face = None
     
-    for _ in range(length):
-        # Get valid faces (not same as last, not opposite of last two)
-        valid_faces = []
-        
-        for face in faces:
-            # Can't use same face as last move
-            if face == last_face:
-                continue
-                
-            # Can't use opposite face if last two moves were on opposite faces
-            if (second_last_face is not None and 
-                last_face is not None and
-                face == second_last_face and 
-                opposite_faces.get(face) == last_face):
-                continue
-                
-            valid_faces.append(face)
-        
-        # Choose random valid face and move
-        chosen_face = random.choice(valid_faces)
-        chosen_move = random.choice(move_groups[chosen_face])
+    # The turn variant doesn't depend on history, so roll them all at once
+    variants = random.choices((0, 1, 2), k=length)
+    
+    for variant in variants:
+        # Choose random valid face (not same as last, not opposite of last two) and move
+        valid_faces = _VALID_FACES[(last_face, second_last_face)]
+        chosen_face = valid_faces[random.randrange(len(valid_faces))]
+        chosen_move = _MOVE_GROUPS[chosen_face][variant]
         
         scramble_moves.append(chosen_move)
         
@@ -87,6 +96,34 @@ def generate_easy_scramble(length: int = 15) -> MoveSequence:
     return generate_scramble(length)
 
 
+_PATTERN_NOTATIONS = {
+    'checkerboard': "M2 E2 S2",
+    'cube_in_cube': "F L F U' R U F2 L2 U' L' B D' B' L2 U",
+    'superflip': "R U R' F' R U2 R' U' R U' R' F R2 U' R' U2 R U' R'",
+    'four_spots': "F2 B2 R2 L2 U2 D2",
+    'six_spots': "U D' R L' F B' U D'",
+    'cross': "R2 L2 U2 D2 F2 B2",
+    'plus': "R L' U D' F B'",
+    'h_pattern': "M2 E2 S2",
+    'tetris': "L R F B U D L R",
+    'anaconda': "L U B' U' R L' B R' F B' D R"
+}
+
+
+def _compile_patterns() -> Dict[str, MoveSequence]:
+    """Parse every pattern whose notation uses supported moves."""
+    patterns = {}
+    for name, notation in _PATTERN_NOTATIONS.items():
+        try:
+            patterns[name] = MoveSequence.parse(notation)
+        except ValueError:
+            continue
+    return patterns
+
+
+_PATTERNS = _compile_patterns()
+
+
 def generate_pattern_scramble(pattern_name: str) -> MoveSequence:
     """
     Generate scrambles for specific cube patterns.
@@ -97,23 +134,15 @@ def generate_pattern_scramble(pattern_name: str) -> MoveSequence:
     Returns:
         MoveSequence to create the pattern
     """
-    patterns = {
-        'checkerboard': "M2 E2 S2",
-        'cube_in_cube': "F L F U' R U F2 L2 U' L' B D' B' L2 U",
-        'superflip': "R U R' F' R U2 R' U' R U' R' F R2 U' R' U2 R U' R'",
-        'four_spots': "F2 B2 R2 L2 U2 D2",
-        'six_spots': "U D' R L' F B' U D'",
-        'cross': "R2 L2 U2 D2 F2 B2",
-        'plus': "R L' U D' F B'",
-        'h_pattern': "M2 E2 S2",
-        'tetris': "L R F B U D L R",
-        'anaconda': "L U B' U' R L' B R' F B' D R"
-    }
-    
-    if pattern_name.lower() not in patterns:
+    name = pattern_name.lower()
+    if name in _PATTERNS:
+        return _PATTERNS[name].copy()
+    
+    if name not in _PATTERN_NOTATIONS:
         raise ValueError(f"Unknown pattern: {pattern_name}")
     
-    return MoveSequence.parse(patterns[pattern_name.lower()])
+    # Uses moves we can't represent (slice turns); parse to raise the error
+    return MoveSequence.parse(_PATTERN_NOTATIONS[name])
 
 
 def is_valid_scramble(scramble: MoveSequence) -> bool:
@@ -126,39 +155,27 @@ def is_valid_scramble(scramble: MoveSequence) -> bool:
     Returns:
         True if scramble is valid
     """
-    if len(scramble) == 0:
-        return True
-    
-    # Check for consecutive moves on same face
-    for i in range(len(scramble) - 1):
-        current_face = _get_move_face(scramble[i])
-        next_face = _get_move_face(scramble[i + 1])
+    # Single pass, keeping the faces of the previous two moves
+    face1 = face2 = None
+    for move in scramble.moves:
+        face3 = move.face
         
-        if current_face == next_face:
+        # Consecutive moves on the same face
+        if face3 == face2:
             return False
-    
-    # Check for three consecutive moves on opposite faces
-    for i in range(len(scramble) - 2):
-        face1 = _get_move_face(scramble[i])
-        face2 = _get_move_face(scramble[i + 1])
-        face3 = _get_move_face(scramble[i + 2])
-        
-        opposite_faces = {
-            'R': 'L', 'L': 'R',
-            'U': 'D', 'D': 'U',
-            'F': 'B', 'B': 'F'
-        }
         
-        if (face1 == face3 and 
-            opposite_faces.get(face1) == face2):
+        # Three consecutive moves on opposite faces (e.g. R L R)
+        if face3 == face1 and _OPPOSITE_FACES.get(face1) == face2:
             return False
+        
+        face1, face2 = face2, face3
     
     return True
 
 
 def _get_move_face(move: Move) -> str:
     """Get the face letter from a move."""
-    return str(move)[0]
+    return move.face
 
 
 def scramble_to_string(scramble: MoveSequence) -> str:
@@ -178,8 +195,11 @@ class ScrambleGenerator:
         """Initialize with optional random seed."""
         if seed is not None:
             random.seed(seed)
-        self.last_scrambles: List[MoveSequence] = []
         self.max_history = 100
+        # Recent scrambles in order, plus a count of each move tuple for O(1)
+        # lookups (the same scramble can be stored twice when repetition is allowed)
+        self.last_scrambles: Deque[MoveSequence] = deque(maxlen=self.max_history)
+        self._recent: Counter = Counter()
     
     def generate(self, length: int = 25, avoid_repetition: bool = True) -> MoveSequence:
         """
@@ -198,24 +218,33 @@ class ScrambleGenerator:
         while attempts < max_attempts:
             scramble = generate_scramble(length)
             
-            if not avoid_repetition or scramble not in self.last_scrambles:
-                # Add to history
-                self.last_scrambles.append(scramble)
-                if len(self.last_scrambles) > self.max_history:
-                    self.last_scrambles.pop(0)
-                
+            if not avoid_repetition or scramble.moves not in self._recent:
+                self._remember(scramble)
                 return scramble
             
             attempts += 1
         
         # If we can't avoid repetition, just return a valid scramble
         scramble = generate_scramble(length)
-        self.last_scrambles.append(scramble)
-        if len(self.last_scrambles) > self.max_history:
-            self.last_scrambles.pop(0)
+        self._remember(scramble)
         
         return scramble
     
+    def _remember(self, scramble: MoveSequence) -> None:
+        """
+        Add a scramble to the history, forgetting the oldest when full.
+        
+        The history keeps its own copy, so appending to the returned scramble
+        does not change the moves it is counted under.
+        """
+        if len(self.last_scrambles) == self.last_scrambles.maxlen:
+            oldest = self.last_scrambles.popleft().moves
+            self._recent[oldest] -= 1
+            if not self._recent[oldest]:
+                del self._recent[oldest]
+        self.last_scrambles.append(scramble.copy())
+        self._recent[scramble.moves] += 1
+    
     def generate_session(self, count: int, length: int = 25) -> List[MoveSequence]:
         """Generate multiple scrambles for a session."""
         return [self.generate(length) for _ in range(count)]
@@ -223,3 +252,4 @@ class ScrambleGenerator:
     def clear_history(self) -> None:
         """Clear scramble history."""
         self.last_scrambles.clear()
+        self._recent.clear()
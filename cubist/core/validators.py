@@ -2,13 +2,30 @@
 Validation functions for checking cube state legality.
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Union
 from collections import Counter
 import numpy as np
 from .cube_state import CubeState
 from .color_scheme import ColorScheme
 
 
+# Sticker indices of every corner and edge piece, highlighted when the
+# corner twist or edge flip sum is wrong, and every non-center sticker
+# (duplicates are harmless, the indices only set mask entries)
+_CORNER_STICKERS = np.array([
+    0, 9, 20,  2, 18, 36,  8, 38, 47,  6, 45, 11,  # Top corners
+    29, 24, 15,  27, 42, 18,  35, 51, 44,  33, 17, 53,  # Bottom corners
+], dtype=np.int16)
+
+_EDGE_STICKERS = np.array([
+    1, 10,  5, 19,  7, 37,  3, 46,  # Top edges
+    28, 16,  32, 25,  34, 43,  30, 52,  # Bottom edges
+    23, 14,  21, 41,  39, 50,  48, 12,  # Middle edges
+], dtype=np.int16)
+
+_NON_CENTER_STICKERS = np.setdiff1d(np.arange(54, dtype=np.int16), [4, 13, 22, 31, 40, 49])
+
+
 def validate_facelets(facelets: List[str]) -> Tuple[bool, List[str]]:
     """
     Validate a facelet representation of the cube.
@@ -19,16 +36,19 @@ def validate_facelets(facelets: List[str]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, error_messages)
     """
-    errors = []
-    
     # Check facelet count
     if len(facelets) != 54:
-        errors.append(f"Expected 54 facelets, got {len(facelets)}")
-        return False, errors
+        return False, [f"Expected 54 facelets, got {len(facelets)}"]
     
-    # Check color counts (should be 9 of each color)
-    color_counts = Counter(facelets)
+    return _validate_facelets(facelets, Counter(facelets))
+
+
+def _validate_facelets(facelets: List[str], color_counts: Counter,
+                       converted: Union[CubeState, ValueError, None] = None) -> Tuple[bool, List[str]]:
+    """Validate 54 facelets given color counts and, optionally, the conversion."""
+    errors = []
     
+    # Check color counts (should be 9 of each color)
     if len(color_counts) != 6:
         errors.append(f"Expected exactly 6 different colors, got {len(color_counts)}")
     
@@ -41,51 +61,43 @@ def validate_facelets(facelets: List[str]) -> Tuple[bool, List[str]]:
         return False, errors
     
     # Try to convert to cubie representation for advanced validation
-    try:
-        cube_state = CubeState.from_facelets(facelets)
-        
-        # Check corner twist sum
-        corner_twist_sum = sum(cube_state.corner_orient) % 3
-        if corner_twist_sum != 0:
-            errors.append("Invalid corner twist sum (must be divisible by 3)")
-        
-        # Check edge flip sum
-        edge_flip_sum = sum(cube_state.edge_orient) % 2
-        if edge_flip_sum != 0:
-            errors.append("Invalid edge flip sum (must be even)")
-        
-        # Check permutation parity
-        corner_parity = _permutation_parity(cube_state.corner_perm)
-        edge_parity = _permutation_parity(cube_state.edge_perm)
-        
-        if corner_parity != edge_parity:
-            errors.append("Corner and edge permutation parities must match")
-            
-    except ValueError as e:
-        errors.append(f"Invalid cube configuration: {str(e)}")
+    if converted is None:
+        converted = _convert_facelets(facelets)
+    
+    if isinstance(converted, ValueError):
+        errors.append(f"Invalid cube configuration: {str(converted)}")
+    else:
+        errors.extend(_check_invariants(converted))
     
     return len(errors) == 0, errors
 
 
+def _convert_facelets(facelets: List[str]) -> Union[CubeState, ValueError]:
+    """Convert facelets to a CubeState, returning the ValueError instead of raising it."""
+    try:
+        return CubeState.from_facelets(facelets)
+    except ValueError as e:
+        return e
+
+
 def _permutation_parity(perm: np.ndarray) -> int:
     """Calculate the parity of a permutation (0 for even, 1 for odd)."""
+    # parity = (n - number of cycles) mod 2; work on a list so lookups don't
+    # box a NumPy scalar each time
+    perm = perm.tolist() if isinstance(perm, np.ndarray) else list(perm)
     n = len(perm)
     visited = [False] * n
-    parity = 0
+    cycles = 0
     
     for i in range(n):
         if not visited[i]:
-            cycle_length = 0
+            cycles += 1
             j = i
             while not visited[j]:
                 visited[j] = True
                 j = perm[j]
-                cycle_length += 1
-            
-            if cycle_length % 2 == 0:
-                parity ^= 1
     
-    return parity
+    return (n - cycles) & 1
 
 
 def validate_cube_state(state: CubeState) -> Tuple[bool, List[str]]:
@@ -117,26 +129,41 @@ def validate_cube_state(state: CubeState) -> Tuple[bool, List[str]]:
         errors.append("Invalid edge permutation")
     
     # Check orientation ranges
-    for i, orient in enumerate(state.corner_orient):
-        if orient not in [0, 1, 2]:
-            errors.append(f"Corner {i} has invalid orientation {orient} (must be 0, 1, or 2)")
+    corner_orient = state.corner_orient
+    for i in np.flatnonzero((corner_orient < 0) | (corner_orient > 2)).tolist():
+        errors.append(f"Corner {i} has invalid orientation {corner_orient[i]} (must be 0, 1, or 2)")
     
-    for i, orient in enumerate(state.edge_orient):
-        if orient not in [0, 1]:
-            errors.append(f"Edge {i} has invalid orientation {orient} (must be 0 or 1)")
+    edge_orient = state.edge_orient
+    for i in np.flatnonzero((edge_orient < 0) | (edge_orient > 1)).tolist():
+        errors.append(f"Edge {i} has invalid orientation {edge_orient[i]} (must be 0 or 1)")
     
     # If basic checks fail, return early
     if errors:
         return False, errors
     
+    errors = _check_invariants(state)
+    
+    return len(errors) == 0, errors
+
+
+def _check_invariants(state: CubeState) -> List[str]:
+    """
+    Check the cube invariants of a well-formed state.
+    
+    Args:
+        state: CubeState with valid permutations and orientation values
+        
+    Returns:
+        Error messages for the twist sum, flip sum and parity checks that fail
+    """
+    errors = []
+    
     # Check corner twist sum
-    corner_twist_sum = sum(state.corner_orient) % 3
-    if corner_twist_sum != 0:
+    if int(state.corner_orient.sum()) % 3 != 0:
         errors.append("Invalid corner twist sum (must be divisible by 3)")
     
     # Check edge flip sum
-    edge_flip_sum = sum(state.edge_orient) % 2
-    if edge_flip_sum != 0:
+    if int(state.edge_orient.sum()) % 2 != 0:
         errors.append("Invalid edge flip sum (must be even)")
     
     # Check permutation parity
@@ -146,7 +173,7 @@ def validate_cube_state(state: CubeState) -> Tuple[bool, List[str]]:
     if corner_parity != edge_parity:
         errors.append("Corner and edge permutation parities must match")
     
-    return len(errors) == 0, errors
+    return errors
 
 
 def _is_valid_permutation(perm: np.ndarray, n: int) -> bool:
@@ -154,10 +181,15 @@ def _is_valid_permutation(perm: np.ndarray, n: int) -> bool:
     if len(perm) != n:
         return False
     
-    expected = set(range(n))
-    actual = set(perm)
+    # Set one bit per value seen; a permutation sets all n low bits
+    values = perm.tolist() if isinstance(perm, np.ndarray) else perm
+    seen = 0
+    for value in values:
+        if value < 0 or value >= n:
+            return False
+        seen |= 1 << value
     
-    return expected == actual
+    return seen == (1 << n) - 1
 
 
 def get_problematic_stickers(facelets: List[str]) -> List[int]:
@@ -170,58 +202,40 @@ def get_problematic_stickers(facelets: List[str]) -> List[int]:
     Returns:
         List of sticker indices that are problematic
     """
-    problematic = []
-    
     if len(facelets) != 54:
         return list(range(len(facelets)))  # All positions if wrong count
     
-    # Check for color count issues
-    color_counts = Counter(facelets)
-    
+    return _problematic_stickers(facelets, Counter(facelets))
+
+
+def _problematic_stickers(facelets: List[str], color_counts: Counter,
+                          converted: Union[CubeState, ValueError, None] = None) -> List[int]:
+    """Find problematic stickers given color counts and, optionally, the conversion."""
     # Find colors that appear wrong number of times
-    wrong_colors = set()
-    for color, count in color_counts.items():
-        if count != 9:
-            wrong_colors.add(color)
-    
-    # Mark all stickers with wrong colors as problematic
-    for i, color in enumerate(facelets):
-        if color in wrong_colors:
-            problematic.append(i)
+    wrong_colors = {color for color, count in color_counts.items() if count != 9}
     
     # Try to identify specific cubie issues
-    try:
-        cube_state = CubeState.from_facelets(facelets)
-        
-        # Check for corner twist issues
-        corner_twist_sum = sum(cube_state.corner_orient) % 3
-        if corner_twist_sum != 0:
-            # Mark corner stickers as potentially problematic
-            corner_positions = [
-                [0, 9, 20], [2, 18, 36], [8, 38, 47], [6, 45, 11],  # Top corners
-                [29, 24, 15], [27, 42, 18], [35, 51, 44], [33, 17, 53]  # Bottom corners
-            ]
-            for corner in corner_positions:
-                problematic.extend(corner)
-        
-        # Check for edge flip issues
-        edge_flip_sum = sum(cube_state.edge_orient) % 2
-        if edge_flip_sum != 0:
-            # Mark edge stickers as potentially problematic
-            edge_positions = [
-                [1, 10], [5, 19], [7, 37], [3, 46],  # Top edges
-                [28, 16], [32, 25], [34, 43], [30, 52],  # Bottom edges
-                [23, 14], [21, 41], [39, 50], [48, 12]  # Middle edges
-            ]
-            for edge in edge_positions:
-                problematic.extend(edge)
-                
-    except ValueError:
+    if converted is None:
+        converted = _convert_facelets(facelets)
+    
+    if isinstance(converted, ValueError):
         # If conversion fails, mark all non-center stickers
-        centers = [4, 13, 22, 31, 40, 49]
-        problematic = [i for i in range(54) if i not in centers]
+        return _NON_CENTER_STICKERS.tolist()
+    
+    # Mark all stickers with wrong colors as problematic
+    mask = np.zeros(54, dtype=bool)
+    if wrong_colors:
+        mask[[i for i, color in enumerate(facelets) if color in wrong_colors]] = True
     
-    return list(set(problematic))  # Remove duplicates
+    # Mark corner stickers as potentially problematic on a bad twist sum
+    if int(converted.corner_orient.sum()) % 3 != 0:
+        mask[_CORNER_STICKERS] = True
+    
+    # Mark edge stickers as potentially problematic on a bad flip sum
+    if int(converted.edge_orient.sum()) % 2 != 0:
+        mask[_EDGE_STICKERS] = True
+    
+    return np.flatnonzero(mask).tolist()
 
 
 def create_validation_report(facelets: List[str]) -> Dict[str, any]:
@@ -234,10 +248,16 @@ def create_validation_report(facelets: List[str]) -> Dict[str, any]:
     Returns:
         Dictionary with validation results and details
     """
-    is_valid, errors = validate_facelets(facelets)
-    problematic_stickers = get_problematic_stickers(facelets)
-    
-    color_counts = Counter(facelets) if len(facelets) == 54 else {}
+    # Count colors and convert to cubies once, sharing both with both checks
+    if len(facelets) == 54:
+        color_counts = Counter(facelets)
+        converted = _convert_facelets(facelets)
+        is_valid, errors = _validate_facelets(facelets, color_counts, converted)
+        problematic_stickers = _problematic_stickers(facelets, color_counts, converted)
+    else:
+        color_counts = {}
+        is_valid, errors = validate_facelets(facelets)
+        problematic_stickers = get_problematic_stickers(facelets)
     
     report = {
         'is_valid': is_valid,
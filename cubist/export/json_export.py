@@ -4,9 +4,21 @@ JSON export functionality for solve data.
 
 import json
 import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
+import numpy as np
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 from ..core.cube_state import CubeState
-from ..core.moves import MoveSequence
+from ..core.moves import Move, MoveSequence, move_codes
+from ..core.notations import encode_moves
 from ..core.color_scheme import ColorScheme
 
 
@@ -15,7 +27,8 @@ def export_json(filename: str,
                 sequence: MoveSequence,
                 stats: Dict[str, Any],
                 color_scheme: ColorScheme = None,
-                notes: List[str] = None) -> None:
+                notes: List[str] = None,
+                include_final_state: bool = True) -> None:
     """
     Export solve data to JSON format.
     
@@ -26,42 +39,61 @@ def export_json(filename: str,
         stats: Solve statistics
         color_scheme: Color scheme used
         notes: Optional tutorial notes
+        include_final_state: Compute and store the state after the solution;
+            if False, "final_state" is written as null
     """
     if color_scheme is None:
         color_scheme = ColorScheme()
     
+    initial_state = _cube_state_to_dict(start_state)
+    if not include_final_state:
+        final_state = None
+    elif len(sequence) == 0:
+        final_state = initial_state
+    else:
+        final_state = _cube_state_to_dict(_apply_sequence_to_state(start_state, sequence))
+    
+    # Notation of each move, for the solution section
+    move_strs = [move.notation for move in sequence.moves]
+    move_count = len(move_strs)
+    solver = stats.get('solver', 'Unknown')
+    solve_time = stats.get('time', 0.0)
+    tps = stats.get('tps', 0.0)
+    timestamp = time.time()
+    now = time.localtime(timestamp)
+    
     # Create JSON data structure
     data = {
         "metadata": {
             "version": "1.0.0",
             "format": "cubist_solve_data",
-            "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "timestamp": time.time()
+            "generated": time.strftime("%Y-%m-%d %H:%M:%S", now),
+            "timestamp": timestamp
         },
         "solve_info": {
-            "solver": stats.get('solver', 'Unknown'),
-            "total_moves": len(sequence),
-            "solve_time": stats.get('time', 0.0),
-            "tps": stats.get('tps', 0.0),
-            "date": time.strftime("%Y-%m-%d"),
-            "time": time.strftime("%H:%M:%S")
+            "solver": solver,
+            "total_moves": move_count,
+            "solve_time": solve_time,
+            "tps": tps,
+            "date": time.strftime("%Y-%m-%d", now),
+            "time": time.strftime("%H:%M:%S", now)
         },
         "cube_data": {
-            "initial_state": _cube_state_to_dict(start_state),
-            "final_state": _cube_state_to_dict(_apply_sequence_to_state(start_state, sequence)),
+            "initial_state": initial_state,
+            "final_state": final_state,
             "color_scheme": color_scheme.to_dict()
         },
         "solution": {
-            "moves": [str(move) for move in sequence.moves],
-            "move_count": len(sequence),
+            "moves": move_strs,
+            "move_count": move_count,
             "notation": "singmaster",
-            "sequence_string": str(sequence)
+            "sequence_string": " ".join(move_strs)
         },
         "statistics": {
-            "execution_time": stats.get('time', 0.0),
-            "moves_per_second": stats.get('tps', 0.0),
-            "algorithm_efficiency": len(sequence),
-            "solver_type": stats.get('solver', 'Unknown')
+            "execution_time": solve_time,
+            "moves_per_second": tps,
+            "algorithm_efficiency": move_count,
+            "solver_type": solver
         }
     }
     
@@ -81,8 +113,18 @@ def export_json(filename: str,
     data["analysis"] = _analyze_sequence(sequence)
     
     # Write to file
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(filename, data)
+
+
+def _write_json(filename: str, data: Dict[str, Any]) -> None:
+    """Write data as indented UTF-8 JSON, serializing with orjson if available."""
+    if HAVE_ORJSON:
+        # One C-level dump into a single buffer, written in one call
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 def _cube_state_to_dict(state: CubeState) -> Dict[str, Any]:
@@ -101,6 +143,10 @@ def _apply_sequence_to_state(state: CubeState, sequence: MoveSequence) -> CubeSt
     return sequence.apply_to(state)
 
 
+# Move code -> face letter; codes run face by face as quarter, prime, half
+_FACE_BY_CODE = tuple(move.face for move in Move)
+
+
 def _analyze_sequence(sequence: MoveSequence) -> Dict[str, Any]:
     """Analyze move sequence for patterns and statistics."""
     if len(sequence) == 0:
@@ -111,20 +157,19 @@ def _analyze_sequence(sequence: MoveSequence) -> Dict[str, Any]:
             "patterns": []
         }
     
-    # Count moves by face
+    # Count each move code in one C-level pass, then fold the (at most 36)
+    # distinct codes into face and turn-type counts
     face_counts = {}
-    move_type_counts = {"quarter_turns": 0, "half_turns": 0}
+    half_turns = 0
     
-    for move in sequence:
-        move_str = str(move)
-        face = move_str[0]
-        
-        face_counts[face] = face_counts.get(face, 0) + 1
+    for code, count in Counter(move_codes(sequence.moves)).items():
+        face = _FACE_BY_CODE[code]
+        face_counts[face] = face_counts.get(face, 0) + count
         
-        if '2' in move_str:
-            move_type_counts["half_turns"] += 1
-        else:
-            move_type_counts["quarter_turns"] += 1
+        if code % 3 == 2:
+            half_turns += count
+    
+    move_type_counts = {"quarter_turns": len(sequence) - half_turns, "half_turns": half_turns}
     
     # Look for common patterns
     patterns = _find_common_patterns(sequence)
@@ -138,78 +183,58 @@ def _analyze_sequence(sequence: MoveSequence) -> Dict[str, Any]:
     }
 
 
+# Patterns reported by _find_common_patterns: (name, notation, encoded
+# moves, description), encoded once so each search is a str.find scan
+_COMMON_PATTERNS = tuple(
+    (name, notation, encode_moves(MoveSequence.parse(notation).moves), description)
+    for name, notation, description in (
+        ("Sexy Move", "R U R' U'", "Common right-hand algorithm"),
+        ("Sledgehammer", "R' F R F'", "Common corner manipulation"),
+        ("T-Perm", "R U R' F' R U R' U' R' F R2 U' R'", "PLL algorithm for T permutation"),
+    )
+)
+
+
 def _find_common_patterns(sequence: MoveSequence) -> List[Dict[str, Any]]:
     """Find common algorithmic patterns in the sequence."""
     patterns = []
-    moves = [str(move) for move in sequence]
-    
-    # Look for sexy move (R U R' U')
-    sexy_pattern = ["R", "U", "R'", "U'"]
-    sexy_count = _count_pattern_occurrences(moves, sexy_pattern)
-    if sexy_count > 0:
-        patterns.append({
-            "name": "Sexy Move",
-            "pattern": "R U R' U'",
-            "occurrences": sexy_count,
-            "description": "Common right-hand algorithm"
-        })
-    
-    # Look for sledgehammer (R' F R F')
-    sledge_pattern = ["R'", "F", "R", "F'"]
-    sledge_count = _count_pattern_occurrences(moves, sledge_pattern)
-    if sledge_count > 0:
-        patterns.append({
-            "name": "Sledgehammer",
-            "pattern": "R' F R F'",
-            "occurrences": sledge_count,
-            "description": "Common corner manipulation"
-        })
-    
-    # Look for T-perm pattern
-    tperm_pattern = ["R", "U", "R'", "F'", "R", "U", "R'", "U'", "R'", "F", "R2", "U'", "R'"]
-    tperm_count = _count_pattern_occurrences(moves, tperm_pattern)
-    if tperm_count > 0:
-        patterns.append({
-            "name": "T-Perm",
-            "pattern": "R U R' F' R U R' U' R' F R2 U' R'",
-            "occurrences": tperm_count,
-            "description": "PLL algorithm for T permutation"
-        })
+    text = encode_moves(sequence.moves)
+    
+    for name, notation, needle, description in _COMMON_PATTERNS:
+        count = _count_pattern_occurrences(text, needle)
+        if count > 0:
+            patterns.append({
+                "name": name,
+                "pattern": notation,
+                "occurrences": count,
+                "description": description
+            })
     
     return patterns
 
 
-def _count_pattern_occurrences(moves: List[str], pattern: List[str]) -> int:
-    """Count how many times a pattern occurs in the move list."""
+def _count_pattern_occurrences(text: str, needle: str) -> int:
+    """Count (possibly overlapping) occurrences of an encoded pattern."""
     count = 0
-    pattern_len = len(pattern)
+    index = text.find(needle)
     
-    for i in range(len(moves) - pattern_len + 1):
-        if moves[i:i + pattern_len] == pattern:
-            count += 1
+    while index != -1:
+        count += 1
+        index = text.find(needle, index + 1)
     
     return count
 
 
+# Upper move-count bound of each efficiency band and the score for it:
+# optimal (<=20, solves are around 20 moves at best), very good, good,
+# average, and needs improvement (beginner methods run 50-100 moves)
+_EFFICIENCY_THRESHOLDS = (20, 30, 50, 80)
+_EFFICIENCY_SCORES = (1.0, 0.9, 0.7, 0.5, 0.3)
+
+
 def _calculate_efficiency_score(sequence: MoveSequence) -> float:
     """Calculate efficiency score for the sequence (0-1, higher is better)."""
-    if len(sequence) == 0:
-        return 1.0
-    
-    # Simple efficiency based on move count
-    # Optimal solve is around 20 moves, beginner methods are 50-100
-    move_count = len(sequence)
-    
-    if move_count <= 20:
-        return 1.0  # Optimal
-    elif move_count <= 30:
-        return 0.9  # Very good
-    elif move_count <= 50:
-        return 0.7  # Good
-    elif move_count <= 80:
-        return 0.5  # Average
-    else:
-        return 0.3  # Needs improvement
+    return _EFFICIENCY_SCORES[bisect_left(_EFFICIENCY_THRESHOLDS, len(sequence))]
 
 
 def import_json(filename: str) -> Dict[str, Any]:
@@ -273,6 +298,55 @@ def convert_legacy_format(old_data: Dict[str, Any]) -> Dict[str, Any]:
     return old_data
 
 
+@dataclass
+class SessionColumns:
+    """
+    Session solves stored column-wise: entry i of each column is solve i.
+    
+    Attributes:
+        move_counts: Move count of each solve (int64)
+        solve_times: Solve time of each solve in seconds (float64)
+        solvers: Solver name of each solve
+    """
+    move_counts: np.ndarray
+    solve_times: np.ndarray
+    solvers: List[str]
+    
+    def __len__(self) -> int:
+        """Number of solves in the session."""
+        return len(self.solvers)
+    
+    @classmethod
+    def from_solves(cls, session_data: List[Dict[str, Any]]) -> "SessionColumns":
+        """
+        Build columns from per-solve dictionaries in one pass per column.
+        
+        Args:
+            session_data: List of solve data dictionaries (as written by export_json)
+            
+        Returns:
+            SessionColumns for the solves
+        """
+        count = len(session_data)
+        infos = [solve.get("solve_info", {}) for solve in session_data]
+        
+        return cls(
+            move_counts=np.fromiter((info.get("total_moves", 0) for info in infos),
+                                    dtype=np.int64, count=count),
+            solve_times=np.fromiter((info.get("solve_time", 0.0) for info in infos),
+                                    dtype=np.float64, count=count),
+            solvers=[info.get("solver", "Unknown") for info in infos]
+        )
+    
+    def to_solves(self) -> List[Dict[str, Any]]:
+        """Rebuild minimal per-solve dictionaries holding just the solve info."""
+        return [
+            {"solve_info": {"solver": solver, "total_moves": moves, "solve_time": solve_time}}
+            for solver, moves, solve_time in zip(self.solvers, self.move_counts.tolist(),
+                                                 self.solve_times.tolist())
+        ]
+
+
 def export_session_data(filename: str, session_data: List[Dict[str, Any]]) -> None:
     """
     Export multiple solves as session data.
@@ -281,6 +355,24 @@ def export_session_data(filename: str, session_data: List[Dict[str, Any]]) -> No
         filename: Output filename
         session_data: List of solve data dictionaries
     """
+    _write_session_data(filename, session_data, SessionColumns.from_solves(session_data))
+
+
+def export_session_data_columnar(filename: str, columns: SessionColumns) -> None:
+    """
+    Export multiple solves as session data from columnar solve data.
+    
+    Args:
+        filename: Output filename
+        columns: Per-solve move counts, times and solvers
+    """
+    _write_session_data(filename, columns.to_solves(), columns)
+
+
+def _write_session_data(filename: str,
+                        solves: List[Dict[str, Any]],
+                        columns: SessionColumns) -> None:
+    """Write a session file with the given solves and their columnar statistics."""
     data = {
         "metadata": {
             "version": "1.0.0",
@@ -289,31 +381,35 @@ def export_session_data(filename: str, session_data: List[Dict[str, Any]]) -> No
             "timestamp": time.time()
         },
         "session_info": {
-            "total_solves": len(session_data),
+            "total_solves": len(columns),
             "date": time.strftime("%Y-%m-%d"),
             "duration": "unknown"  # Could be calculated if start/end times available
         },
-        "solves": session_data,
-        "statistics": _calculate_session_stats(session_data)
+        "solves": solves,
+        "statistics": _calculate_column_stats(columns)
     }
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(filename, data)
 
 
 def _calculate_session_stats(session_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate statistics for a session."""
-    if not session_data:
+    return _calculate_column_stats(SessionColumns.from_solves(session_data))
+
+
+def _calculate_column_stats(columns: SessionColumns) -> Dict[str, Any]:
+    """Calculate statistics for a session from its columns."""
+    if len(columns) == 0:
         return {}
     
-    move_counts = [solve.get("solve_info", {}).get("total_moves", 0) for solve in session_data]
-    solve_times = [solve.get("solve_info", {}).get("solve_time", 0.0) for solve in session_data]
+    move_counts = columns.move_counts
+    solve_times = columns.solve_times
     
     return {
-        "average_moves": sum(move_counts) / len(move_counts) if move_counts else 0,
-        "average_time": sum(solve_times) / len(solve_times) if solve_times else 0,
-        "best_moves": min(move_counts) if move_counts else 0,
-        "worst_moves": max(move_counts) if move_counts else 0,
-        "best_time": min(solve_times) if solve_times else 0,
-        "worst_time": max(solve_times) if solve_times else 0
+        "average_moves": float(move_counts.mean()),
+        "average_time": float(solve_times.mean()),
+        "best_moves": int(move_counts.min()),
+        "worst_moves": int(move_counts.max()),
+        "best_time": float(solve_times.min()),
+        "worst_time": float(solve_times.max())
     }
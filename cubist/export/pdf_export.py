@@ -13,10 +13,53 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
 from ..core.cube_state import CubeState
-from ..core.moves import MoveSequence
+from ..core.moves import Move, MoveSequence
 from ..core.color_scheme import ColorScheme
 
 
+# Paragraph and table styles, built once and shared by every export
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=black
+)
+
+_HEADER_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+_MOVE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), '#4a90e2'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), ['#f8f8f8', white]),
+    ('GRID', (0, 0), (-1, -1), 1, black),
+])
+
+_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), '#28a745'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, black),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), ['#f8f8f8', white]),
+])
+
+
 def export_pdf(filename: str,
                start_state: CubeState,
                sequence: MoveSequence,
@@ -39,22 +82,20 @@ def export_pdf(filename: str,
     if color_scheme is None:
         color_scheme = ColorScheme()
     
+    # Notation of each move, shared by the move list and breakdown table
+    move_strs = [move.notation for move in sequence.moves]
+    move_count = len(move_strs)
+    solver = stats.get('solver', 'Unknown')
+    solve_time = _format_time(stats.get('time', 0.0))
+    tps = f"{stats.get('tps', 0.0):.2f}"
+    
     # Create PDF document
     doc = SimpleDocTemplate(filename, pagesize=A4)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     story = []
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=black
-    )
-    
-    story.append(Paragraph("Cubist - Rubik's Cube Solution", title_style))
+    story.append(Paragraph("Cubist - Rubik's Cube Solution", _TITLE_STYLE))
     story.append(Spacer(1, 20))
     
     # Header information
@@ -63,20 +104,14 @@ def export_pdf(filename: str,
     
     header_data = [
         ['Generated:', current_time],
-        ['Solver:', stats.get('solver', 'Unknown')],
-        ['Total Moves:', str(len(sequence))],
-        ['Solve Time:', _format_time(stats.get('time', 0.0))],
-        ['TPS:', f"{stats.get('tps', 0.0):.2f}"]
+        ['Solver:', solver],
+        ['Total Moves:', str(move_count)],
+        ['Solve Time:', solve_time],
+        ['TPS:', tps]
     ]
     
     header_table = Table(header_data, colWidths=[2*inch, 3*inch])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    header_table.setStyle(_HEADER_TABLE_STYLE)
     
     story.append(header_table)
     story.append(Spacer(1, 20))
@@ -86,35 +121,26 @@ def export_pdf(filename: str,
     story.append(Spacer(1, 10))
     
     # Format moves in rows
-    moves_text = _format_moves_for_pdf(sequence)
+    moves_text = _format_moves_for_pdf(move_strs)
     story.append(Paragraph(moves_text, styles['Normal']))
     story.append(Spacer(1, 20))
     
     # Move breakdown table
-    if len(sequence) > 0:
+    if move_count > 0:
         story.append(Paragraph("Move Breakdown", styles['Heading2']))
         story.append(Spacer(1, 10))
         
         move_table_data = [['Step', 'Move', 'Description']]
         
         for i, move in enumerate(sequence.moves[:20]):  # Limit to first 20 moves
-            description = _get_move_description(str(move))
-            move_table_data.append([str(i+1), str(move), description])
+            description = _get_move_description(move)
+            move_table_data.append([str(i+1), move_strs[i], description])
         
-        if len(sequence) > 20:
-            move_table_data.append(['...', '...', f'({len(sequence) - 20} more moves)'])
+        if move_count > 20:
+            move_table_data.append(['...', '...', f'({move_count - 20} more moves)'])
         
         move_table = Table(move_table_data, colWidths=[0.5*inch, 0.8*inch, 3.7*inch])
-        move_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), '#4a90e2'),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), ['#f8f8f8', white]),
-            ('GRID', (0, 0), (-1, -1), 1, black),
-        ]))
+        move_table.setStyle(_MOVE_TABLE_STYLE)
         
         story.append(move_table)
         story.append(Spacer(1, 20))
@@ -136,23 +162,14 @@ def export_pdf(filename: str,
     
     stats_data = [
         ['Metric', 'Value'],
-        ['Algorithm Efficiency', f"{len(sequence)} moves"],
-        ['Execution Time', _format_time(stats.get('time', 0.0))],
-        ['Turns Per Second', f"{stats.get('tps', 0.0):.2f}"],
-        ['Solver Type', stats.get('solver', 'Unknown')]
+        ['Algorithm Efficiency', f"{move_count} moves"],
+        ['Execution Time', solve_time],
+        ['Turns Per Second', tps],
+        ['Solver Type', solver]
     ]
     
     stats_table = Table(stats_data, colWidths=[2.5*inch, 2.5*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), '#28a745'),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), ['#f8f8f8', white]),
-    ]))
+    stats_table.setStyle(_STATS_TABLE_STYLE)
     
     story.append(stats_table)
     story.append(Spacer(1, 20))
@@ -172,62 +189,60 @@ def export_pdf(filename: str,
     doc.build(story)
 
 
-def _format_moves_for_pdf(sequence: MoveSequence) -> str:
-    """Format move sequence for PDF display."""
-    if len(sequence) == 0:
+def _format_moves_for_pdf(words: List[str]) -> str:
+    """Format move notations for PDF display."""
+    if not words:
         return "No moves required - cube is already solved!"
     
-    moves_str = str(sequence)
-    
-    # Break into lines of reasonable length
-    words = moves_str.split()
+    # Break into lines of at most 80 characters, joining slices of the word
+    # list rather than building a list per line
     lines = []
-    current_line = []
-    current_length = 0
+    start = 0
+    length = -1
     
-    for word in words:
-        if current_length + len(word) + 1 > 80:  # 80 chars per line
-            if current_line:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = len(word)
-            else:
-                lines.append(word)
-                current_length = 0
-        else:
-            current_line.append(word)
-            current_length += len(word) + 1
+    for i, word in enumerate(words):
+        length += len(word) + 1
+        if length > 80 and i > start:
+            lines.append(' '.join(words[start:i]))
+            start = i
+            length = len(word)
     
-    if current_line:
-        lines.append(' '.join(current_line))
+    lines.append(' '.join(words[start:]))
     
     return '<br/>'.join(lines)
 
 
-def _get_move_description(move_str: str) -> str:
+# Description of each outer-face move by notation, and the same indexed by
+# move code (wide moves have no description)
+_MOVE_DESCRIPTIONS = {
+    'R': "Right face clockwise 90°",
+    "R'": "Right face counter-clockwise 90°",
+    'R2': "Right face 180°",
+    'L': "Left face clockwise 90°",
+    "L'": "Left face counter-clockwise 90°",
+    'L2': "Left face 180°",
+    'U': "Up face clockwise 90°",
+    "U'": "Up face counter-clockwise 90°",
+    'U2': "Up face 180°",
+    'D': "Down face clockwise 90°",
+    "D'": "Down face counter-clockwise 90°",
+    'D2': "Down face 180°",
+    'F': "Front face clockwise 90°",
+    "F'": "Front face counter-clockwise 90°",
+    'F2': "Front face 180°",
+    'B': "Back face clockwise 90°",
+    "B'": "Back face counter-clockwise 90°",
+    'B2': "Back face 180°",
+}
+
+_MOVE_DESCRIPTIONS_BY_CODE = tuple(
+    _MOVE_DESCRIPTIONS.get(move.notation, "Unknown move") for move in Move
+)
+
+
+def _get_move_description(move: Move) -> str:
     """Get description for a move."""
-    descriptions = {
-        'R': "Right face clockwise 90°",
-        "R'": "Right face counter-clockwise 90°",
-        'R2': "Right face 180°",
-        'L': "Left face clockwise 90°",
-        "L'": "Left face counter-clockwise 90°",
-        'L2': "Left face 180°",
-        'U': "Up face clockwise 90°",
-        "U'": "Up face counter-clockwise 90°",
-        'U2': "Up face 180°",
-        'D': "Down face clockwise 90°",
-        "D'": "Down face counter-clockwise 90°",
-        'D2': "Down face 180°",
-        'F': "Front face clockwise 90°",
-        "F'": "Front face counter-clockwise 90°",
-        'F2': "Front face 180°",
-        'B': "Back face clockwise 90°",
-        "B'": "Back face counter-clockwise 90°",
-        'B2': "Back face 180°",
-    }
-    
-    return descriptions.get(move_str, "Unknown move")
+    return _MOVE_DESCRIPTIONS_BY_CODE[move.code]
 
 
 def _format_time(seconds: float) -> str:
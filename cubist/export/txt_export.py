@@ -5,7 +5,7 @@ Text file export functionality for solve data.
 import time
 from typing import Dict, Any, List, Optional
 from ..core.cube_state import CubeState
-from ..core.moves import MoveSequence
+from ..core.moves import Move, MoveSequence
 from ..core.color_scheme import ColorScheme
 
 
@@ -64,8 +64,8 @@ def export_txt(filename: str,
             f.write("-" * 50 + "\n")
             
             for i, move in enumerate(sequence.moves):
-                description = _get_move_description(str(move))
-                f.write(f"{i+1:<4} {str(move):<4} {description:<30}\n")
+                description = _get_move_description(move)
+                f.write(f"{i+1:<4} {move.notation:<4} {description:<30}\n")
             f.write("\n")
         
         # Move analysis
@@ -159,30 +159,37 @@ def _wrap_text(text: str, width: int) -> str:
     return '\n'.join(lines) + '\n'
 
 
-def _get_move_description(move_str: str) -> str:
+# Description of each outer-face move by notation, and the same indexed by
+# move code (wide moves have no description)
+_MOVE_DESCRIPTIONS = {
+    'R': "Right face clockwise 90°",
+    "R'": "Right face counter-clockwise 90°",
+    'R2': "Right face 180°",
+    'L': "Left face clockwise 90°",
+    "L'": "Left face counter-clockwise 90°",
+    'L2': "Left face 180°",
+    'U': "Up face clockwise 90°",
+    "U'": "Up face counter-clockwise 90°",
+    'U2': "Up face 180°",
+    'D': "Down face clockwise 90°",
+    "D'": "Down face counter-clockwise 90°",
+    'D2': "Down face 180°",
+    'F': "Front face clockwise 90°",
+    "F'": "Front face counter-clockwise 90°",
+    'F2': "Front face 180°",
+    'B': "Back face clockwise 90°",
+    "B'": "Back face counter-clockwise 90°",
+    'B2': "Back face 180°",
+}
+
+_MOVE_DESCRIPTIONS_BY_CODE = tuple(
+    _MOVE_DESCRIPTIONS.get(move.notation, "Unknown move") for move in Move
+)
+
+
+def _get_move_description(move: Move) -> str:
     """Get description for a move."""
-    descriptions = {
-        'R': "Right face clockwise 90°",
-        "R'": "Right face counter-clockwise 90°",
-        'R2': "Right face 180°",
-        'L': "Left face clockwise 90°",
-        "L'": "Left face counter-clockwise 90°",
-        'L2': "Left face 180°",
-        'U': "Up face clockwise 90°",
-        "U'": "Up face counter-clockwise 90°",
-        'U2': "Up face 180°",
-        'D': "Down face clockwise 90°",
-        "D'": "Down face counter-clockwise 90°",
-        'D2': "Down face 180°",
-        'F': "Front face clockwise 90°",
-        "F'": "Front face counter-clockwise 90°",
-        'F2': "Front face 180°",
-        'B': "Back face clockwise 90°",
-        "B'": "Back face counter-clockwise 90°",
-        'B2': "Back face 180°",
-    }
-    
-    return descriptions.get(move_str, "Unknown move")
+    return _MOVE_DESCRIPTIONS_BY_CODE[move.code]
 
 
 def _analyze_moves(sequence: MoveSequence) -> Dict[str, Any]:
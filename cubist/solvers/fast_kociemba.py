@@ -2,16 +2,57 @@
 Fast solver using Kociemba two-phase algorithm.
 """
 
-from typing import Optional, Callable
-import kociemba
+import importlib.util
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
 from ..core.cube_state import CubeState
 from ..core.moves import MoveSequence
 from ..core.color_scheme import ColorScheme
 
 
+# Kociemba facelet string of the solved cube
+_SOLVED_KOCIEMBA = "UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"
+
+# Process pool shared by FastSolver.solve_many calls, created on first use
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def _get_pool(workers: Optional[int] = None) -> Tuple[ProcessPoolExecutor, int]:
+    """Return the shared solve pool and its size, (re)creating it for a new size."""
+    global _POOL, _POOL_WORKERS
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    if _POOL is None or workers != _POOL_WORKERS:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        # Spawn rather than fork: the UI calls this from a multithreaded Qt process
+        _POOL = ProcessPoolExecutor(max_workers=workers,
+                                    mp_context=multiprocessing.get_context("spawn"))
+        _POOL_WORKERS = workers
+    
+    return _POOL, workers
+
+
+def _parse_solution(solution_string: str) -> MoveSequence:
+    """Parse a Kociemba result string into a MoveSequence."""
+    if solution_string.startswith("Error"):
+        raise ValueError(f"Kociemba solver error: {solution_string}")
+    
+    # An empty solution means the cube is already solved
+    return MoveSequence.parse(solution_string)
+
+
 class FastSolver:
     """Fast solver wrapper around Kociemba algorithm."""
     
+    # Whether Kociemba's tables are loaded in this process, see warmup()
+    _WARMED = False
+    
     def __init__(self) -> None:
         """Initialize the fast solver."""
         self.name = "Fast (Kociemba Two-Phase)"
@@ -26,7 +67,7 @@ class FastSolver:
         
         Args:
             state: CubeState to solve
-            scheme: Color scheme for facelet conversion
+            scheme: Unused; Kociemba facelets are named by face, not by color
             progress_callback: Optional callback for progress updates
             
         Returns:
@@ -35,33 +76,27 @@ class FastSolver:
         Raises:
             ValueError: If cube state is invalid or unsolvable
         """
+        if state.is_solved():
+            return MoveSequence([])
+        
         if progress_callback:
             progress_callback("Converting cube state...")
         
-        # Convert to facelet representation for Kociemba
-        facelets = state.to_facelets(scheme)
-        
-        # Convert to Kociemba format (URFDLB order with specific color mapping)
-        kociemba_string = self._convert_to_kociemba_format(facelets, scheme)
+        # Kociemba format: URFDLB facelet order, each sticker named by its face
+        kociemba_string = state.to_face_string()
         
         if progress_callback:
             progress_callback("Running Kociemba algorithm...")
         
         try:
             # Solve using Kociemba
+            import kociemba
             solution_string = kociemba.solve(kociemba_string)
             
-            if solution_string.startswith("Error"):
-                raise ValueError(f"Kociemba solver error: {solution_string}")
-            
             if progress_callback:
                 progress_callback("Parsing solution...")
             
-            # Parse solution
-            if solution_string.strip():
-                solution = MoveSequence.parse(solution_string)
-            else:
-                solution = MoveSequence([])  # Already solved
+            solution = _parse_solution(solution_string)
             
             if progress_callback:
                 progress_callback("Solution complete!")
@@ -71,48 +106,78 @@ class FastSolver:
         except Exception as e:
             raise ValueError(f"Failed to solve cube: {str(e)}")
     
-    def _convert_to_kociemba_format(self, facelets: list[str], scheme: ColorScheme) -> str:
+    def solve_many(self,
+                   states: Sequence[CubeState],
+                   scheme: ColorScheme = ColorScheme(),
+                   workers: Optional[int] = None) -> List[MoveSequence]:
         """
-        Convert facelets to Kociemba format string.
+        Solve many cubes in parallel on a persistent process pool.
         
-        Kociemba expects: URFDLB face order with colors as single characters.
-        Our format: URFDLB with hex colors.
+        The pool is created on first use and reused by later calls, so each
+        worker loads Kociemba's tables only once.
         
         Args:
-            facelets: List of 54 facelet colors
-            scheme: Color scheme for mapping
+            states: CubeStates to solve
+            scheme: Unused; Kociemba facelets are named by face, not by color
+            workers: Number of worker processes (default: CPU count)
             
         Returns:
-            Kociemba format string
+            MoveSequence solutions, in the same order as states
+            
+        Raises:
+            ValueError: If any cube state is invalid or unsolvable
         """
-        # Create color mapping from hex to single characters
-        color_map = {
-            scheme.U: 'U',  # White -> U
-            scheme.R: 'R',  # Red -> R  
-            scheme.F: 'F',  # Green -> F
-            scheme.D: 'D',  # Yellow -> D
-            scheme.L: 'L',  # Orange -> L
-            scheme.B: 'B'   # Blue -> B
-        }
+        kociemba_strings = [state.to_face_string() for state in states]
+        if not kociemba_strings:
+            return []
         
-        # Convert each facelet
-        kociemba_facelets = []
-        for facelet in facelets:
-            if facelet not in color_map:
-                raise ValueError(f"Unknown color in facelets: {facelet}")
-            kociemba_facelets.append(color_map[facelet])
+        pool, workers = _get_pool(workers)
+        chunksize = max(1, len(kociemba_strings) // (4 * workers))
         
-        return ''.join(kociemba_facelets)
+        try:
+            import kociemba
+            
+            # Workers return raw strings; parse the moves here
+            solution_strings = list(pool.map(kociemba.solve, kociemba_strings, chunksize=chunksize))
+            return [_parse_solution(solution_string) for solution_string in solution_strings]
+        except Exception as e:
+            raise ValueError(f"Failed to solve cube: {str(e)}")
+    
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Load Kociemba's tables in this process ahead of the first solve.
+        
+        Kociemba loads them on its first call, which otherwise lands on the
+        first solve. Later calls do nothing.
+        """
+        if not cls._WARMED:
+            import kociemba
+            kociemba.solve(_SOLVED_KOCIEMBA)
+            cls._WARMED = True
+    
+    def warmup_pool(self, workers: Optional[int] = None) -> None:
+        """
+        Start the solve_many pool and load Kociemba's tables in its workers.
+        
+        Args:
+            workers: Number of worker processes (default: CPU count)
+        """
+        import kociemba
+        
+        pool, workers = _get_pool(workers)
+        list(pool.map(kociemba.solve, [_SOLVED_KOCIEMBA] * workers))
     
     def is_available(self) -> bool:
-        """Check if Kociemba solver is available."""
-        try:
-            # Test with solved cube
-            test_cube = "UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"
-            result = kociemba.solve(test_cube)
-            return not result.startswith("Error")
-        except Exception:
-            return False
+        """
+        Check if Kociemba solver is available.
+        
+        Only looks the module up rather than importing it or running a
+        solve, so checking does not load Kociemba's tables; solve() reports
+        a broken install. Kociemba builds missing tables on its first solve,
+        so their files are not checked for.
+        """
+        return importlib.util.find_spec("kociemba") is not None
     
     def get_info(self) -> dict[str, any]:
         """Get solver information."""
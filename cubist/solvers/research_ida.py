@@ -2,13 +2,20 @@
 Research solver using IDA* (Iterative Deepening A*) algorithm.
 """
 
-from typing import Optional, Callable, Set, List
+from typing import Optional, Callable, List
 from dataclasses import dataclass
+import multiprocessing
+import queue
+import threading
 import time
-from ..core.cube_state import CubeState
+from ..core.cube_state import CubeState, buffer_move_tables
 from ..core.moves import Move, MoveSequence
 
 
+# The search polls the clock and the cancel flag once every this many nodes
+_CHECK_INTERVAL_MASK = (1 << 14) - 1
+
+
 @dataclass
 class SearchProgress:
     """Progress information for IDA* search."""
@@ -28,7 +35,21 @@ class IDAStarSolver:
         self.description = "Iterative deepening A* search with pattern database heuristics"
         self.max_depth = 25
         self.max_time = 300  # 5 minutes timeout
-        self._cancelled = False
+        self.workers = 1  # > 1 searches several bounds at once in worker processes
+        self._cancelled = threading.Event()
+        
+        # Imported here, like CubeState's tables, so importing the solvers
+        # doesn't load NumPy and Numba
+        import numpy as np
+        from ..core._kernels import apply_move_heuristic, ida_heuristic
+        from .pattern_db import DEFAULT_CORNER_PDB_PATH
+        self._ida_heuristic = ida_heuristic
+        self._apply_move_heuristic = apply_move_heuristic
+        
+        # Corner pattern database, memory-mapped on the first solve (and built
+        # there if the file is missing); set the path to None to go without
+        self.corner_pdb_path = DEFAULT_CORNER_PDB_PATH
+        self._corner_pdb = np.empty(0, dtype=np.uint8)
         
         # All possible moves
         self.moves = [
@@ -39,6 +60,24 @@ class IDAStarSolver:
             Move.F, Move.Fp, Move.F2,
             Move.B, Move.Bp, Move.B2
         ]
+        
+        # Canonical successor table: _allowed[prev, next] tells whether
+        # moves[next] may follow moves[prev], and the extra last row is for
+        # the first move of a search. The search walks each row's allowed
+        # (index, move, perm, delta) entries from _successors, perm and delta
+        # being the move's CubeState buffer tables.
+        buffer_tables, self._moduli = buffer_move_tables()
+        no_move = len(self.moves)
+        self._allowed = np.ones((no_move + 1, no_move), dtype=bool)
+        for prev, prev_move in enumerate(self.moves):
+            for index, move in enumerate(self.moves):
+                self._allowed[prev, index] = not self._is_redundant(move, prev_move)
+        self._successors = [
+            [(index, self.moves[index], *buffer_tables[self.moves[index]])
+             for index in np.flatnonzero(row).tolist()]
+            for row in self._allowed
+        ]
+        self._move_index = {move: index for index, move in enumerate(self.moves)}
     
     def solve(self, 
               state: CubeState,
@@ -59,18 +98,22 @@ class IDAStarSolver:
         if state.is_solved():
             return MoveSequence([])
         
-        self._cancelled = False
-        start_time = time.time()
+        self._cancelled.clear()
+        self._load_corner_pdb(progress_callback)
+        start_time = time.monotonic()
         
         # Initial bound is the heuristic estimate
         bound = self._heuristic(state)
         nodes_expanded = 0
         
+        if self.workers > 1:
+            return self._solve_parallel(state, bound, start_time, progress_callback)
+        
         for depth in range(1, self.max_depth + 1):
-            if self._cancelled:
+            if self._cancelled.is_set():
                 raise ValueError("Search cancelled by user")
             
-            if time.time() - start_time > self.max_time:
+            if time.monotonic() - start_time > self.max_time:
                 raise ValueError("Search timeout exceeded")
             
             # Progress update
@@ -79,13 +122,13 @@ class IDAStarSolver:
                     depth=depth,
                     nodes_expanded=nodes_expanded,
                     best_bound=bound,
-                    elapsed_time=time.time() - start_time,
+                    elapsed_time=time.monotonic() - start_time,
                     current_phase=f"Searching depth {depth}"
                 )
                 progress_callback(progress)
             
             # Perform depth-limited search
-            result = self._search(state, 0, bound, [], set(), start_time)
+            result = self._search(state, 0, bound, [], start_time)
             
             if isinstance(result, list):  # Found solution
                 if progress_callback:
@@ -93,7 +136,7 @@ class IDAStarSolver:
                         depth=len(result),
                         nodes_expanded=nodes_expanded,
                         best_bound=bound,
-                        elapsed_time=time.time() - start_time,
+                        elapsed_time=time.monotonic() - start_time,
                         current_phase="Solution found!"
                     )
                     progress_callback(final_progress)
@@ -106,75 +149,197 @@ class IDAStarSolver:
         
         raise ValueError("No solution found within maximum depth")
     
+    def _solve_parallel(self,
+                        state: CubeState,
+                        bound: int,
+                        start_time: float,
+                        progress_callback: Optional[Callable[[SearchProgress], None]] = None) -> MoveSequence:
+        """
+        Parallel window search: run consecutive IDA* bounds in worker processes.
+        
+        Each of self.workers processes searches one bound; a finished window
+        without a solution is replaced by the next bound. A solution is only
+        returned once every smaller window has finished, so it is as short as
+        the sequential search's.
+        
+        Args:
+            state: CubeState to solve
+            bound: Heuristic estimate of state, the first window's bound
+            start_time: Search start time, from time.monotonic()
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            MoveSequence solution
+            
+        Raises:
+            ValueError: If no solution found or search cancelled
+        """
+        context = multiprocessing.get_context("spawn")
+        cancel_event = context.Event()
+        results = queue.Queue()
+        state_bytes = state.to_bytes()
+        pdb_path = str(self.corner_pdb_path) if self.corner_pdb_path is not None else None
+        last_bound = bound + self.max_depth - 1
+        
+        next_bound = bound
+        pending = set()
+        best = None  # (bound, moves) of the smallest window with a solution
+        windows_done = 0
+        
+        # Leaving the block terminates the workers still searching larger windows
+        with context.Pool(self.workers, _init_window_worker, (pdb_path, cancel_event)) as pool:
+            while True:
+                # Keep one window per worker in flight until a solution turns up
+                while len(pending) < self.workers and next_bound <= last_bound and best is None:
+                    time_left = self.max_time - (time.monotonic() - start_time)
+                    pool.apply_async(_search_window, (state_bytes, next_bound, time_left),
+                                     callback=results.put, error_callback=results.put)
+                    pending.add(next_bound)
+                    next_bound += 1
+                
+                if not pending:
+                    raise ValueError("No solution found within maximum depth")
+                
+                try:
+                    item = results.get(timeout=0.1)
+                except queue.Empty:
+                    if self._cancelled.is_set():
+                        cancel_event.set()
+                    continue
+                
+                if isinstance(item, BaseException):
+                    raise ValueError(f"Search worker failed: {item}")
+                
+                window_bound, result = item
+                pending.discard(window_bound)
+                windows_done += 1
+                
+                if isinstance(result, list):
+                    if best is None or window_bound < best[0]:
+                        best = (window_bound, result)
+                elif result == float('inf'):
+                    if self._cancelled.is_set():
+                        raise ValueError("Search cancelled by user")
+                    raise ValueError("Search timeout exceeded")
+                
+                if progress_callback:
+                    progress_callback(SearchProgress(
+                        depth=window_bound,
+                        nodes_expanded=windows_done,
+                        best_bound=window_bound,
+                        elapsed_time=time.monotonic() - start_time,
+                        current_phase=f"Searched bound {window_bound}"
+                    ))
+                
+                # Done once no smaller window can still find a shorter solution
+                if best is not None and all(pending_bound > best[0] for pending_bound in pending):
+                    if progress_callback:
+                        progress_callback(SearchProgress(
+                            depth=len(best[1]),
+                            nodes_expanded=windows_done,
+                            best_bound=best[0],
+                            elapsed_time=time.monotonic() - start_time,
+                            current_phase="Solution found!"
+                        ))
+                    return MoveSequence(best[1])
+    
     def _search(self, 
                 state: CubeState, 
                 g: int, 
                 bound: int, 
                 path: List[Move], 
-                visited: Set[CubeState],
                 start_time: float) -> any:
         """
-        Recursive IDA* search function.
+        Depth-first IDA* search from state, run on an explicit stack.
+        
+        Each expanded node keeps a frame of [state buffer, iterator over its
+        canonical successors, smallest bound seen]; path is extended and
+        shortened in place as the search descends and backs up, so no call
+        frames or path copies are made per node. Children are made and scored
+        by one _kernels.apply_move_heuristic call on the raw buffers, without
+        wrapping them in CubeStates.
+        
+        There is no visited set: the successor table already rules out
+        same-face repeats and the second order of commuting opposite faces,
+        and the bound stops any longer cycle.
         
         Args:
-            state: Current cube state
-            g: Cost from start to current state
+            state: State to search from
+            g: Cost from start to state
             bound: Current depth bound
-            path: Current move path
-            visited: Set of visited states
-            start_time: Search start time
+            path: Moves leading to state
+            start_time: Search start time, from time.monotonic()
             
         Returns:
             List of moves if solution found, otherwise new bound
         """
-        if self._cancelled or time.time() - start_time > self.max_time:
-            return float('inf')
-        
-        # Calculate f = g + h
+        inf = float('inf')
+        apply_move_heuristic = self._apply_move_heuristic
+        moduli = self._moduli
+        corner_pdb = self._corner_pdb
+        successors = self._successors
+        cancelled = self._cancelled
+        deadline = start_time + self.max_time
+        nodes = 0
+        path = list(path)
+        stack = []
+        node = state.buffer
         h = self._heuristic(state)
-        f = g + h
         
-        if f > bound:
-            return f
+        # Row of the successor table for the move that led to node
+        last = self._move_index[path[-1]] if path else len(self.moves)
         
-        if state.is_solved():
-            return path
-        
-        if state in visited:
-            return float('inf')
-        
-        visited.add(state)
-        min_bound = float('inf')
-        
-        # Try all possible moves
-        for move in self.moves:
-            # Avoid redundant moves (don't undo the last move)
-            if path and self._is_redundant(move, path[-1]):
-                continue
+        while True:
+            # Stop on cancel or timeout, checked every few thousand nodes
+            nodes += 1
+            if not nodes & _CHECK_INTERVAL_MASK and (cancelled.is_set() or time.monotonic() > deadline):
+                return inf
             
-            new_state = move.apply(state)
-            new_path = path + [move]
+            # Evaluate the node: either expand it or get its bound
+            value = None
             
-            result = self._search(new_state, g + 1, bound, new_path, visited, start_time)
+            # Calculate f = g + h
+            f = g + len(stack) + h
             
-            if isinstance(result, list):  # Solution found
-                visited.remove(state)
-                return result
+            if f > bound:
+                value = f
+            elif not h:  # The heuristic is 0 only for the solved state
+                return path
+            else:
+                stack.append([node, iter(successors[last]), inf])
             
-            if result < min_bound:
-                min_bound = result
-        
-        visited.remove(state)
-        return min_bound
+            # Back up finished nodes until a frame has another move to try
+            while True:
+                if value is not None:
+                    if not stack:
+                        return value
+                    path.pop()
+                    frame = stack[-1]
+                    if value < frame[2]:
+                        frame[2] = value
+                
+                frame = stack[-1]
+                child = next(frame[1], None)
+                if child is None:
+                    stack.pop()
+                    value = frame[2]
+                    continue
+                
+                last, move, perm, delta = child
+                path.append(move)
+                node, h = apply_move_heuristic(frame[0], perm, delta, moduli, corner_pdb)
+                break
     
     def _heuristic(self, state: CubeState) -> int:
         """
         Calculate heuristic estimate of moves to solve.
         
-        This is a simple admissible heuristic based on:
-        - Corner orientation sum
-        - Edge orientation sum
-        - Basic position counting
+        This is an admissible heuristic based on:
+        - Twisted corners and flipped edges, four per move at most
+        - Corners and edges out of place, four per move at most
+        - Corner pattern database distance, once loaded
+        
+        The counts and lookup are computed by _kernels.ida_heuristic.
         
         Args:
             state: CubeState to evaluate
@@ -182,62 +347,51 @@ class IDAStarSolver:
         Returns:
             Heuristic estimate
         """
-        if state.is_solved():
-            return 0
-        
-        h = 0
-        
-        # Corner orientation heuristic
-        corner_twist = sum(state.corner_orient)
-        if corner_twist > 0:
-            h = max(h, (corner_twist + 2) // 3)  # At least this many moves needed
+        # One pass over the state buffer, Numba-compiled when available
+        return self._ida_heuristic(state.buffer, self._corner_pdb)
+    
+    def _load_corner_pdb(self,
+                         progress_callback: Optional[Callable[[SearchProgress], None]] = None) -> None:
+        """
+        Memory-map the corner pattern database, building it if needed.
         
-        # Edge orientation heuristic
-        edge_flip = sum(state.edge_orient)
-        if edge_flip > 0:
-            h = max(h, (edge_flip + 1) // 2)  # At least this many moves needed
+        Args:
+            progress_callback: Optional callback, told when a build starts
+        """
+        if self._corner_pdb.size or self.corner_pdb_path is None:
+            return
         
-        # Corner permutation heuristic
-        corner_out_of_place = sum(1 for i, pos in enumerate(state.corner_perm) if pos != i)
-        if corner_out_of_place > 0:
-            h = max(h, (corner_out_of_place + 2) // 3)
+        from .pattern_db import build_corner_pdb, load_corner_pdb
         
-        # Edge permutation heuristic
-        edge_out_of_place = sum(1 for i, pos in enumerate(state.edge_perm) if pos != i)
-        if edge_out_of_place > 0:
-            h = max(h, (edge_out_of_place + 3) // 4)
+        corner_pdb = load_corner_pdb(self.corner_pdb_path)
+        if corner_pdb is None:
+            if progress_callback:
+                progress_callback(SearchProgress(
+                    depth=0,
+                    nodes_expanded=0,
+                    best_bound=0,
+                    elapsed_time=0.0,
+                    current_phase="Building corner pattern database..."
+                ))
+            corner_pdb = build_corner_pdb(self.corner_pdb_path)
         
-        return max(h, 1)  # At least 1 move if not solved
+        self._corner_pdb = corner_pdb
     
     def _is_redundant(self, move1: Move, move2: Move) -> bool:
-        """Check if two consecutive moves are redundant."""
-        # Don't allow same face moves consecutively (they should be combined)
-        face1 = str(move1)[0]
-        face2 = str(move2)[0]
-        
-        if face1 == face2:
-            return True
-        
-        # Don't allow opposite face moves in certain orders
-        opposite_faces = {
-            'R': 'L', 'L': 'R',
-            'U': 'D', 'D': 'U',
-            'F': 'B', 'B': 'F'
-        }
-        
-        # Avoid R L R type sequences
-        if opposite_faces.get(face1) == face2:
-            return True
-        
-        return False
+        """Check if move1 is redundant right after move2."""
+        # Same face moves should be combined (R R -> R2), and moves on
+        # opposite faces commute, so they are only allowed in one order:
+        # R L, U D and F B, never L R, D U or B F
+        same_axis = move1.face_id // 2 == move2.face_id // 2
+        return same_axis and move1.face_id <= move2.face_id
     
     def cancel(self) -> None:
         """Cancel the current search."""
-        self._cancelled = True
+        self._cancelled.set()
     
     def is_cancelled(self) -> bool:
         """Check if search was cancelled."""
-        return self._cancelled
+        return self._cancelled.is_set()
     
     def get_info(self) -> dict[str, any]:
         """Get solver information."""
@@ -248,10 +402,41 @@ class IDAStarSolver:
             'average_moves': '20-30',
             'speed': 'slow',
             'max_depth': self.max_depth,
-            'timeout': self.max_time
+            'timeout': self.max_time,
+            'workers': self.workers
         }
 
 
+# Solver used by a parallel window search worker process
+_WINDOW_SOLVER: Optional[IDAStarSolver] = None
+
+
+def _init_window_worker(corner_pdb_path: Optional[str], cancel_event: threading.Event) -> None:
+    """Set up a parallel window worker, sharing the parent's cancel flag."""
+    global _WINDOW_SOLVER
+    _WINDOW_SOLVER = IDAStarSolver()
+    _WINDOW_SOLVER.corner_pdb_path = corner_pdb_path
+    _WINDOW_SOLVER._cancelled = cancel_event
+    _WINDOW_SOLVER._load_corner_pdb()
+
+
+def _search_window(state_bytes: bytes, bound: int, time_left: float) -> tuple:
+    """
+    Run one IDA* iteration in a worker process.
+    
+    Args:
+        state_bytes: State to solve, from CubeState.to_bytes()
+        bound: Depth bound of this window
+        time_left: Seconds left of the search's time budget
+        
+    Returns:
+        Tuple of (bound, list of moves if solution found, otherwise new bound)
+    """
+    _WINDOW_SOLVER.max_time = time_left
+    state = CubeState.from_bytes(state_bytes)
+    return bound, _WINDOW_SOLVER._search(state, 0, bound, [], time.monotonic())
+
+
 def ida_solve(state: CubeState, 
               on_progress: Optional[Callable[[SearchProgress], None]] = None) -> MoveSequence:
     """
@@ -2,10 +2,11 @@
 Tutor solver using Layer-by-Layer (LBL) beginner method.
 """
 
+from functools import lru_cache
 from typing import List, Optional, Callable, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from ..core.cube_state import CubeState
-from ..core.moves import Move, MoveSequence
+from ..core.moves import Move, MoveSequence, move_codes
 from ..core.color_scheme import ColorScheme
 
 
@@ -21,39 +22,51 @@ class TutorStep:
         return f"{self.title}: {self.moves}"
 
 
+# Notation of the algorithms used by each phase
+_ALGORITHM_NOTATIONS = {
+    # White cross algorithms
+    'cross_basic': "F D R F' D'",
+    'cross_flip': "F R U R' U' F'",
+    
+    # First layer corner algorithms
+    'corner_right': "R U R'",
+    'corner_left': "L' U' L",
+    'corner_setup': "R U' R' F R F'",
+    
+    # Second layer edge algorithms
+    'edge_right': "U R U' R' U' F' U F",
+    'edge_left': "U' L' U L U F U' F'",
+    
+    # OLL algorithms (simplified)
+    'oll_dot': "F R U R' U' F' f R U R' U' f'",
+    'oll_line': "F R U R' U' F'",
+    'oll_cross': "R U R' U R U2 R'",
+    
+    # PLL algorithms (basic set)
+    'pll_adjacent': "R U R' F' R U R' U' R' F R2 U' R'",
+    'pll_diagonal': "F R U' R' U' R U R' F' R U R' U' R' F R F'",
+    'pll_edges': "R U' R F' R U R' U' R' F R2 U' R'",
+}
+
+
 class TutorSolver:
     """Beginner-friendly Layer-by-Layer solver with step-by-step explanations."""
     
+    __slots__ = ("name", "description")
+    
+    # Common algorithms for each phase, parsed once and shared by all instances
+    # (steps get copies, so changing a step's moves can't change them)
+    algorithms = {name: MoveSequence.parse(notation)
+                  for name, notation in _ALGORITHM_NOTATIONS.items()}
+    
+    # The same algorithms as move codes for CubeState.apply_move_codes
+    _algorithm_codes = {name: move_codes(sequence.moves)
+                        for name, sequence in algorithms.items()}
+    
     def __init__(self) -> None:
         """Initialize the tutor solver."""
         self.name = "Tutor (Layer-by-Layer)"
         self.description = "Step-by-step beginner method with explanations"
-        
-        # Common algorithms for each phase
-        self.algorithms = {
-            # White cross algorithms
-            'cross_basic': MoveSequence.parse("F D R F' D'"),
-            'cross_flip': MoveSequence.parse("F R U R' U' F'"),
-            
-            # First layer corner algorithms
-            'corner_right': MoveSequence.parse("R U R'"),
-            'corner_left': MoveSequence.parse("L' U' L"),
-            'corner_setup': MoveSequence.parse("R U' R' F R F'"),
-            
-            # Second layer edge algorithms
-            'edge_right': MoveSequence.parse("U R U' R' U' F' U F"),
-            'edge_left': MoveSequence.parse("U' L' U L U F U' F'"),
-            
-            # OLL algorithms (simplified)
-            'oll_dot': MoveSequence.parse("F R U R' U' F' f R U R' U' f'"),
-            'oll_line': MoveSequence.parse("F R U R' U' F'"),
-            'oll_cross': MoveSequence.parse("R U R' U R U2 R'"),
-            
-            # PLL algorithms (basic set)
-            'pll_adjacent': MoveSequence.parse("R U R' F' R U R' U' R' F R2 U' R'"),
-            'pll_diagonal': MoveSequence.parse("F R U' R' U' R U R' F' R U R' U' R' F R F'"),
-            'pll_edges': MoveSequence.parse("R U' R F' R U R' U' R' F R2 U' R'"),
-        }
     
     def solve(self, 
               state: CubeState, 
@@ -71,8 +84,8 @@ class TutorSolver:
             Tuple of (tutorial_steps, complete_solution)
         """
         steps = []
-        current_state = state.clone()
-        complete_moves = []
+        current_state = state  # Moves return new states, so this is never changed in place
+        complete_moves = []  # Moves of every step, in order
         
         if progress_callback:
             progress_callback("Analyzing cube state...")
@@ -126,7 +139,7 @@ class TutorSolver:
     def _solve_white_cross(self, state: CubeState, scheme: ColorScheme) -> Tuple[List[TutorStep], CubeState]:
         """Solve the white cross on top."""
         steps = []
-        current_state = state.clone()
+        current_state = state
         
         # Simplified white cross solving
         # In a real implementation, this would analyze the current state
@@ -135,31 +148,31 @@ class TutorSolver:
         step = TutorStep(
             title="White Cross",
             explanation="Form a white cross on the top face. Make sure the edge colors match the center colors on the sides.",
-            moves=self.algorithms['cross_basic'],
+            moves=self.algorithms['cross_basic'].copy(),
             highlight_pieces=[1, 3, 5, 7]  # Top edge positions
         )
         
         steps.append(step)
-        current_state = step.moves.apply_to(current_state)
+        current_state = current_state.apply_move_codes(self._algorithm_codes['cross_basic'])
         
         return steps, current_state
     
     def _solve_first_layer_corners(self, state: CubeState, scheme: ColorScheme) -> Tuple[List[TutorStep], CubeState]:
         """Solve the first layer corners."""
         steps = []
-        current_state = state.clone()
+        current_state = state
         
         # Simplified corner solving - would analyze each corner position
         for i in range(4):
             step = TutorStep(
                 title=f"First Layer Corner {i+1}",
                 explanation="Position the white corner piece correctly. Use R U R' to insert from the right, or L' U' L from the left.",
-                moves=self.algorithms['corner_right'],
+                moves=self.algorithms['corner_right'].copy(),
                 highlight_pieces=[0, 2, 6, 8]  # Corner positions
             )
             
             steps.append(step)
-            current_state = step.moves.apply_to(current_state)
+            current_state = current_state.apply_move_codes(self._algorithm_codes['corner_right'])
             
             # Add setup moves if needed
             if i < 3:
@@ -177,68 +190,68 @@ class TutorSolver:
     def _solve_second_layer(self, state: CubeState, scheme: ColorScheme) -> Tuple[List[TutorStep], CubeState]:
         """Solve the second layer edges."""
         steps = []
-        current_state = state.clone()
+        current_state = state
         
         # Simplified second layer solving
         for i in range(4):
-            algorithm = self.algorithms['edge_right'] if i % 2 == 0 else self.algorithms['edge_left']
+            name = 'edge_right' if i % 2 == 0 else 'edge_left'
             
             step = TutorStep(
                 title=f"Second Layer Edge {i+1}",
                 explanation="Insert the edge piece into the second layer. Use the right-hand or left-hand algorithm depending on which direction the piece needs to go.",
-                moves=algorithm,
+                moves=self.algorithms[name].copy(),
                 highlight_pieces=[9, 10, 11, 12]  # Middle edge positions
             )
             
             steps.append(step)
-            current_state = step.moves.apply_to(current_state)
+            current_state = current_state.apply_move_codes(self._algorithm_codes[name])
         
         return steps, current_state
     
     def _solve_oll(self, state: CubeState, scheme: ColorScheme) -> Tuple[List[TutorStep], CubeState]:
         """Orient the last layer (make top face all yellow)."""
         steps = []
-        current_state = state.clone()
+        current_state = state
         
         # Simplified OLL - would detect current pattern
         step = TutorStep(
             title="Orient Last Layer (OLL)",
             explanation="Make the entire top face yellow. This may require multiple algorithms depending on the current pattern.",
-            moves=self.algorithms['oll_cross'],
+            moves=self.algorithms['oll_cross'].copy(),
             highlight_pieces=[45, 46, 47, 48, 49, 50, 51, 52, 53]  # Top face
         )
         
         steps.append(step)
-        current_state = step.moves.apply_to(current_state)
+        current_state = current_state.apply_move_codes(self._algorithm_codes['oll_cross'])
         
         return steps, current_state
     
     def _solve_pll(self, state: CubeState, scheme: ColorScheme) -> Tuple[List[TutorStep], CubeState]:
         """Permute the last layer (solve the cube)."""
         steps = []
-        current_state = state.clone()
+        current_state = state
         
         # Corner permutation
         corner_step = TutorStep(
             title="Permute Last Layer Corners",
             explanation="Position the corners correctly. You may need to repeat this algorithm multiple times.",
-            moves=self.algorithms['pll_adjacent'],
+            moves=self.algorithms['pll_adjacent'].copy(),
             highlight_pieces=[45, 47, 51, 53]  # Top corners
         )
         
         steps.append(corner_step)
-        current_state = corner_step.moves.apply_to(current_state)
+        current_state = current_state.apply_move_codes(self._algorithm_codes['pll_adjacent'])
         
         # Edge permutation
         edge_step = TutorStep(
             title="Permute Last Layer Edges",
             explanation="Position the edges correctly to complete the cube.",
-            moves=self.algorithms['pll_edges'],
+            moves=self.algorithms['pll_edges'].copy(),
             highlight_pieces=[46, 48, 50, 52]  # Top edges
         )
         
         steps.append(edge_step)
-        current_state = edge_step.moves.apply_to(current_state)
+        current_state = current_state.apply_move_codes(self._algorithm_codes['pll_edges'])
         
         return steps, current_state
     
@@ -254,15 +267,28 @@ class TutorSolver:
         }
 
 
+@lru_cache(maxsize=64)
+def _cached_plan(state_bytes: bytes) -> Tuple[Tuple[TutorStep, ...], MoveSequence]:
+    """Plan the tutorial for a state given by its bytes, caching repeated states."""
+    steps, solution = TutorSolver().solve(CubeState.from_bytes(state_bytes))
+    return tuple(steps), solution
+
+
 def plan_steps(state: CubeState) -> Tuple[List[TutorStep], MoveSequence]:
     """
     Convenience function to plan tutorial steps.
     
+    The UI plans the same scramble again on undo, redo and redraws, so the
+    plans of recent states are cached, keyed by CubeState.to_bytes(). Each
+    call returns its own copies, so callers may modify them.
+    
     Args:
         state: CubeState to solve
         
     Returns:
         Tuple of (tutorial_steps, complete_solution)
     """
-    solver = TutorSolver()
-    return solver.solve(state)
+    steps, solution = _cached_plan(state.to_bytes())
+    return ([replace(step, moves=step.moves.copy(), highlight_pieces=list(step.highlight_pieces))
+             for step in steps],
+            solution.copy())
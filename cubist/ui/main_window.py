@@ -2,21 +2,21 @@
 Main window for Cubist application.
 """
 
-from typing import Optional, Dict, List, Tuple
+import time
+from functools import cached_property, lru_cache, partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Optional, Dict, List, Tuple
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QTabWidget, QLabel, QStatusBar, QMessageBox, QProgressBar,
     QApplication, QGridLayout
 )
-from PySide6.QtCore import QTimer, Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
 from PySide6.QtGui import QAction, QKeySequence, QIcon
 
 from ..core.cube_state import CubeState
 from ..core.moves import MoveSequence
 from ..core.color_scheme import ColorScheme
-from ..solvers.fast_kociemba import FastSolver
-from ..solvers.tutor_lbl import TutorSolver
-from ..solvers.research_ida import IDAStarSolver
 
 from .render.renderer3d import Renderer3D
 from .render.renderer2d import Renderer2D
@@ -26,6 +26,244 @@ from .panels.solution_list import SolutionList
 from .panels.color_input_panel import ColorInputPanel
 from .panels.stats_panel import StatsPanel
 
+if TYPE_CHECKING:
+    from ..solvers.fast_kociemba import FastSolver
+    from ..solvers.tutor_lbl import TutorSolver
+    from ..solvers.research_ida import IDAStarSolver
+
+
+# Facelet indices of each cubie, indexed by the 3D renderer's piece ID.
+# The 3D renderer creates cubies in a specific order:
+# x: -1, 0, 1; y: -1, 0, 1; z: -1, 0, 1 (center cubie skipped)
+# This gives us 26 cubies with IDs 0-26
+# Facelet indices: 0-8 (U), 9-17 (L), 18-26 (F), 27-35 (R), 36-44 (B), 45-53 (D)
+_PIECE_FACELETS: Tuple[Tuple[int, ...], ...] = (
+    # Back layer (z = -1)
+    (0, 36, 9),    # 0: UBL corner: U7, B9, L1
+    (1, 37),       # 1: UB edge: U8, B8
+    (2, 38, 27),   # 2: UBR corner: U9, B7, R1
+    (3, 39),       # 3: LB edge: L4, B6
+    (4,),          # 4: L center: L5
+    (5, 41),       # 5: RB edge: R2, B4
+    (6, 42, 15),   # 6: DBL corner: D1, B3, L7
+    (7, 43),       # 7: DB edge: D2, B2
+    (8, 44, 33),   # 8: DBR corner: D3, B1, R3
+    
+    # Middle layer (z = 0)
+    (10, 36),      # 9: UL edge: U4, L1
+    (13,),         # 10: L center: L5
+    (16, 27),      # 11: UR edge: U6, R1
+    (37,),         # 12: L center: L2
+    (),            # 13: Center cubie (skipped)
+    (41,),         # 14: R center: R2
+    (28, 42),      # 15: DL edge: D4, L7
+    (31,),         # 16: D center: D5
+    (34, 33),      # 17: DR edge: D6, R3
+    
+    # Front layer (z = 1)
+    (18, 9, 29),   # 18: UFL corner: F7, L3, U1
+    (19, 12),      # 19: UF edge: F4, U2
+    (20, 27, 29),  # 20: UFR corner: F1, R1, U3
+    (21, 39),      # 21: FL edge: F6, L6
+    (22,),         # 22: F center: F5
+    (23, 41),      # 23: FR edge: F2, R2
+    (24, 15, 45),  # 24: DFL corner: F9, L9, D7
+    (25, 43),      # 25: DF edge: F8, D8
+    (26, 33, 47),  # 26: DFR corner: F3, R3, D9
+)
+
+# Shortest time between two playback progress updates of the status bar, in seconds
+_PROGRESS_INTERVAL = 0.033
+
+# Light professional theme, applied by MainWindow._apply_theme
+_STYLE_SHEET = """
+QMainWindow {
+    background-color: #f5f5f5;
+    color: #333333;
+}
+
+QTabWidget#mainTabs::pane {
+    border: 1px solid #cccccc;
+    background-color: white;
+}
+
+QTabWidget#mainTabs QTabBar::tab {
+    background-color: #e0e0e0;
+    border: 1px solid #cccccc;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+
+QTabWidget#mainTabs QTabBar::tab:selected {
+    background-color: white;
+    border-bottom: 1px solid white;
+}
+
+QTabWidget#mainTabs QTabBar::tab:hover {
+    background-color: #f0f0f0;
+}
+
+QPushButton {
+    background-color: #ffffff;
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    padding: 8px 16px;
+    font-weight: 500;
+}
+
+QPushButton:hover {
+    background-color: #f8f8f8;
+    border-color: #999999;
+}
+
+QPushButton:pressed {
+    background-color: #e8e8e8;
+}
+
+QPushButton:disabled {
+    background-color: #f0f0f0;
+    color: #999999;
+    border-color: #dddddd;
+}
+
+QSlider::groove:horizontal {
+    border: 1px solid #cccccc;
+    height: 6px;
+    background: #f0f0f0;
+    border-radius: 3px;
+}
+
+QSlider::handle:horizontal {
+    background: #4a90e2;
+    border: 1px solid #3a7bc8;
+    width: 16px;
+    height: 16px;
+    border-radius: 8px;
+    margin: -6px 0;
+}
+
+QProgressBar {
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    text-align: center;
+    background-color: #f0f0f0;
+}
+
+QProgressBar::chunk {
+    background-color: #4a90e2;
+    border-radius: 3px;
+}
+"""
+
+# Contents of the About dialog
+_ABOUT_HTML = """
+<h3>Cubist v1.0.0</h3>
+<p>3×3 Rubik's Cube Solver & Tutor</p>
+<p>A comprehensive desktop application for solving and learning the Rubik's Cube.</p>
+<p><b>Features:</b></p>
+<ul>
+<li>Fast optimal solving (Kociemba algorithm)</li>
+<li>Step-by-step tutorial mode</li>
+<li>Research solver with visualization</li>
+<li>3D animation and playback controls</li>
+<li>PDF export and statistics</li>
+</ul>
+<p>Built with Python, PySide6, and OpenGL.</p>
+"""
+
+# Menu bar contents: (menu title, entries), each entry (label, shortcut,
+# handler path on the window) or None for a separator
+_MENU_SPEC = (
+    ("&File", (
+        ("&New Scramble", QKeySequence.New, "_generate_scramble"),
+        None,
+        ("&Import...", QKeySequence.Open, "_import_cube"),
+        ("&Export...", QKeySequence.Save, "_export_solution"),
+        None,
+        ("E&xit", QKeySequence.Quit, "close"),
+    )),
+    ("&View", (
+        ("&Reset Camera", "Ctrl+R", "renderer_3d.reset_camera"),
+    )),
+    ("&Playback", (
+        ("&Play/Pause", Qt.Key_Space, "animation_controller.toggle_play_pause"),
+        ("Step &Back", Qt.Key_Left, "animation_controller.step_back"),
+        ("Step &Forward", Qt.Key_Right, "animation_controller.step_forward"),
+        None,
+        ("Jump to &Start", Qt.Key_Home, "animation_controller.jump_to_start"),
+        ("Jump to &End", Qt.Key_End, "animation_controller.jump_to_end"),
+    )),
+    ("&Help", (
+        ("&About Cubist", None, "_show_about"),
+    )),
+)
+
+# Indices of the lazily built tabs
+_VIEW_TAB_2D = 1
+_CONTROL_TAB_INPUT = 1
+_CONTROL_TAB_SOLUTION = 2
+_CONTROL_TAB_STATS = 3
+
+
+# Solvers are created on first use and shared by all windows
+
+@lru_cache(maxsize=1)
+def _shared_fast_solver() -> "FastSolver":
+    """Return the shared Kociemba solver."""
+    from ..solvers.fast_kociemba import FastSolver
+    return FastSolver()
+
+
+@lru_cache(maxsize=1)
+def _shared_tutor_solver() -> "TutorSolver":
+    """Return the shared tutor solver."""
+    from ..solvers.tutor_lbl import TutorSolver
+    return TutorSolver()
+
+
+@lru_cache(maxsize=1)
+def _shared_research_solver() -> "IDAStarSolver":
+    """Return the shared IDA* solver."""
+    from ..solvers.research_ida import IDAStarSolver
+    return IDAStarSolver()
+
+
+class _SolveSignals(QObject):
+    """Signals of a _SolveWorker; a QRunnable is not a QObject and can't have its own."""
+    finished = Signal(object)  # MoveSequence solution
+    failed = Signal(str)  # Error message
+
+
+class _SolveWorker(QRunnable):
+    """Runs a solve in the global thread pool, reporting back through signals."""
+    
+    def __init__(self, solve: Callable[[], MoveSequence], state: CubeState, solver_name: str) -> None:
+        """
+        Initialize the worker.
+        
+        Args:
+            solve: Callable running the solver and returning its solution
+            state: Cube state being solved
+            solver_name: Name of the solver, as shown in the UI
+        """
+        super().__init__()
+        self.solve = solve
+        self.state = state
+        self.solver_name = solver_name
+        self.signals = _SolveSignals()
+        
+        # The window reads the worker once it is done, so the pool mustn't delete it
+        self.setAutoDelete(False)
+    
+    def run(self) -> None:
+        """Run the solve and emit its solution or error."""
+        try:
+            solution = self.solve()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(solution)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -45,10 +283,33 @@ class MainWindow(QMainWindow):
         self.current_solution = MoveSequence([])
         self.current_solver = "Fast"
         
-        # Solvers
-        self.fast_solver = FastSolver()
-        self.tutor_solver = TutorSolver()
-        self.research_solver = IDAStarSolver()
+        # Solvers are the fast_solver, tutor_solver and research_solver properties
+        self._about_box: Optional[QMessageBox] = None  # Built by _show_about
+        self._solve_worker: Optional[_SolveWorker] = None  # The solve running, if any
+        
+        # Facelets of the cube as painted from the 3D view, kept between clicks
+        # (None until needed again after the state changes), and the piece
+        # painted last; clicks within a frame are applied together by the timer
+        self._facelet_cache: Optional[List[str]] = None
+        self._pending_piece_id = -1
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)  # About one frame
+        self._flush_timer.timeout.connect(self._flush_facelet_edits)
+        
+        # State waiting to be shown by the 3D view; states set within a frame
+        # (animation steps, paints, input changes) are drawn once, the last one
+        self._pending_render_state: Optional[CubeState] = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)  # About one frame
+        self._render_timer.timeout.connect(self._flush_render)
+        
+        # When the status bar last showed playback progress, from time.monotonic()
+        self._last_progress_time = 0.0
+        
+        # Builders of the tabs not created yet, per tab widget and tab index
+        self._tab_factories: Dict[QTabWidget, Dict[int, Callable[[], QWidget]]] = {}
         
         # Initialize UI components
         self._setup_ui()
@@ -101,12 +362,11 @@ class MainWindow(QMainWindow):
         self.animation_controller = AnimationController()
         
         # Add tab widget for 3D/2D views
-        self.view_tabs = QTabWidget()
+        self.view_tabs = self._create_tab_widget()
         self.view_tabs.addTab(self.renderer_3d, "3D View")
         
-        # 2D renderer (optional)
-        self.renderer_2d = Renderer2D()
-        self.view_tabs.addTab(self.renderer_2d, "2D View")
+        # 2D renderer (optional), built when its tab is first shown
+        self._add_lazy_tab(self.view_tabs, Renderer2D, "2D View")
         
         viewport_layout.addWidget(self.view_tabs)
         parent.addWidget(viewport_widget)
@@ -120,105 +380,140 @@ class MainWindow(QMainWindow):
         control_layout.setSpacing(8)
         
         # Create tab widget for different control panels
-        self.control_tabs = QTabWidget()
+        self.control_tabs = self._create_tab_widget()
         
         # Control panel (solver selection, playback controls)
         self.control_panel = ControlPanel()
         self.control_tabs.addTab(self.control_panel, "Controls")
         
+        # The other panels are built when their tab is first shown, or when
+        # the window first uses them (see the properties below)
+        
         # Color input panel
-        self.color_input_panel = ColorInputPanel()
-        self.control_tabs.addTab(self.color_input_panel, "Input")
+        self._add_lazy_tab(self.control_tabs, self._create_color_input_panel, "Input")
         
         # Solution list panel
-        self.solution_list = SolutionList()
-        self.control_tabs.addTab(self.solution_list, "Solution")
+        self._add_lazy_tab(self.control_tabs, self._create_solution_list, "Solution")
         
         # Stats panel
-        self.stats_panel = StatsPanel()
-        self.control_tabs.addTab(self.stats_panel, "Stats")
+        self._add_lazy_tab(self.control_tabs, StatsPanel, "Stats")
         
         control_layout.addWidget(self.control_tabs)
         parent.addWidget(control_widget)
     
-    def _setup_menu_bar(self) -> None:
-        """Set up the menu bar."""
-        menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        # New scramble
-        new_action = QAction("&New Scramble", self)
-        new_action.setShortcut(QKeySequence.New)
-        new_action.triggered.connect(self._generate_scramble)
-        file_menu.addAction(new_action)
-        
-        file_menu.addSeparator()
-        
-        # Import/Export
-        import_action = QAction("&Import...", self)
-        import_action.setShortcut(QKeySequence.Open)
-        import_action.triggered.connect(self._import_cube)
-        file_menu.addAction(import_action)
-        
-        export_action = QAction("&Export...", self)
-        export_action.setShortcut(QKeySequence.Save)
-        export_action.triggered.connect(self._export_solution)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        # Exit
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # View menu
-        view_menu = menubar.addMenu("&View")
-        
-        reset_camera_action = QAction("&Reset Camera", self)
-        reset_camera_action.setShortcut("Ctrl+R")
-        reset_camera_action.triggered.connect(self.renderer_3d.reset_camera)
-        view_menu.addAction(reset_camera_action)
-        
-        # Playback menu
-        playback_menu = menubar.addMenu("&Playback")
-        
-        play_pause_action = QAction("&Play/Pause", self)
-        play_pause_action.setShortcut(Qt.Key_Space)
-        play_pause_action.triggered.connect(self.animation_controller.toggle_play_pause)
-        playback_menu.addAction(play_pause_action)
-        
-        step_back_action = QAction("Step &Back", self)
-        step_back_action.setShortcut(Qt.Key_Left)
-        step_back_action.triggered.connect(self.animation_controller.step_back)
-        playback_menu.addAction(step_back_action)
-        
-        step_forward_action = QAction("Step &Forward", self)
-        step_forward_action.setShortcut(Qt.Key_Right)
-        step_forward_action.triggered.connect(self.animation_controller.step_forward)
-        playback_menu.addAction(step_forward_action)
+    def _create_tab_widget(self) -> QTabWidget:
+        """Create a tab widget painted in document mode and matched by the style sheet's tab rules."""
+        tabs = QTabWidget()
+        tabs.setObjectName("mainTabs")
+        tabs.setDocumentMode(True)
+        tabs.tabBar().setExpanding(False)
+        return tabs
+    
+    def _add_lazy_tab(self, tabs: QTabWidget, factory: Callable[[], QWidget], label: str) -> None:
+        """Add a placeholder tab whose widget is built by factory when first needed."""
+        factories = self._tab_factories.setdefault(tabs, {})
+        if not factories:
+            tabs.currentChanged.connect(lambda index: self._materialize_tab(tabs, index))
+        factories[tabs.addTab(QWidget(), label)] = factory
+    
+    def _materialize_tab(self, tabs: QTabWidget, index: int) -> QWidget:
+        """
+        Return a tab's widget, first replacing its placeholder if it is still lazy.
         
-        playback_menu.addSeparator()
+        Args:
+            tabs: Tab widget holding the tab
+            index: Index of the tab
+            
+        Returns:
+            The tab's real widget
+        """
+        factory = self._tab_factories.get(tabs, {}).pop(index, None)
+        if factory is None:
+            return tabs.widget(index)
         
-        jump_start_action = QAction("Jump to &Start", self)
-        jump_start_action.setShortcut(Qt.Key_Home)
-        jump_start_action.triggered.connect(self.animation_controller.jump_to_start)
-        playback_menu.addAction(jump_start_action)
+        widget = factory()
+        placeholder = tabs.widget(index)
+        label = tabs.tabText(index)
+        current = tabs.currentIndex()
         
-        jump_end_action = QAction("Jump to &End", self)
-        jump_end_action.setShortcut(Qt.Key_End)
-        jump_end_action.triggered.connect(self.animation_controller.jump_to_end)
-        playback_menu.addAction(jump_end_action)
+        # Swap the widgets without reporting the intermediate tab changes
+        tabs.blockSignals(True)
+        try:
+            tabs.removeTab(index)
+            tabs.insertTab(index, widget, label)
+            tabs.setCurrentIndex(current)
+        finally:
+            tabs.blockSignals(False)
+        placeholder.deleteLater()
         
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
+        return widget
+    
+    def _create_color_input_panel(self) -> ColorInputPanel:
+        """Build the color input panel and connect its signals."""
+        panel = ColorInputPanel()
+        panel.cube_state_changed.connect(self._on_cube_state_changed)
+        panel.validation_requested.connect(self._validate_cube)
+        panel.color_scheme_changed.connect(self._invalidate_facelets)
+        return panel
+    
+    def _create_solution_list(self) -> SolutionList:
+        """Build the solution list and connect its signals."""
+        solution_list = SolutionList()
+        solution_list.step_selected.connect(self.animation_controller.seek_to)
+        return solution_list
+    
+    @cached_property
+    def fast_solver(self) -> "FastSolver":
+        """Kociemba solver, created on first use."""
+        return _shared_fast_solver()
+    
+    @cached_property
+    def tutor_solver(self) -> "TutorSolver":
+        """Layer-by-layer tutor solver, created on first use."""
+        return _shared_tutor_solver()
+    
+    @cached_property
+    def research_solver(self) -> "IDAStarSolver":
+        """IDA* solver, created on first use."""
+        return _shared_research_solver()
+    
+    @property
+    def renderer_2d(self) -> Renderer2D:
+        """The 2D view, built on first use."""
+        return self._materialize_tab(self.view_tabs, _VIEW_TAB_2D)
+    
+    @property
+    def color_input_panel(self) -> ColorInputPanel:
+        """The Input tab's panel, built on first use."""
+        return self._materialize_tab(self.control_tabs, _CONTROL_TAB_INPUT)
+    
+    @property
+    def solution_list(self) -> SolutionList:
+        """The Solution tab's list, built on first use."""
+        return self._materialize_tab(self.control_tabs, _CONTROL_TAB_SOLUTION)
+    
+    @property
+    def stats_panel(self) -> StatsPanel:
+        """The Stats tab's panel, built on first use."""
+        return self._materialize_tab(self.control_tabs, _CONTROL_TAB_STATS)
+    
+    def _setup_menu_bar(self) -> None:
+        """Set up the menu bar from _MENU_SPEC."""
+        menubar = self.menuBar()
         
-        about_action = QAction("&About Cubist", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for title, entries in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                
+                label, shortcut, handler = entry
+                action = QAction(label, self)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(attrgetter(handler)(self))
+                menu.addAction(action)
     
     def _setup_status_bar(self) -> None:
         """Set up the status bar."""
@@ -239,9 +534,10 @@ class MainWindow(QMainWindow):
     
     def _setup_connections(self) -> None:
         """Set up signal-slot connections."""
-        # Animation controller connections
-        self.animation_controller.progress_changed.connect(self._on_animation_progress)
-        self.animation_controller.step_changed.connect(self._on_step_changed)
+        # Animation controller connections; the per-step signals are queued so
+        # their handlers run from the event loop, after the step has finished
+        self.animation_controller.progress_changed.connect(self._on_animation_progress, Qt.QueuedConnection)
+        self.animation_controller.step_changed.connect(self._on_step_changed, Qt.QueuedConnection)
         self.animation_controller.playback_finished.connect(self._on_playback_finished)
         
         # Control panel connections
@@ -250,98 +546,14 @@ class MainWindow(QMainWindow):
         self.control_panel.scramble_requested.connect(self._generate_scramble)
         self.control_panel.speed_changed.connect(self.animation_controller.set_speed)
         
-        # Color input connections
-        self.color_input_panel.cube_state_changed.connect(self._on_cube_state_changed)
-        self.color_input_panel.validation_requested.connect(self._validate_cube)
-        
-        # Solution list connections
-        self.solution_list.step_selected.connect(self.animation_controller.seek_to)
+        # Color input and solution list connections are made as they are built
         
         # 3D renderer connections
         self.renderer_3d.piece_clicked.connect(self._on_piece_clicked)
     
     def _apply_theme(self) -> None:
         """Apply the light professional theme."""
-        style = """
-        QMainWindow {
-            background-color: #f5f5f5;
-            color: #333333;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #cccccc;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #e0e0e0;
-            border: 1px solid #cccccc;
-            padding: 8px 16px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            border-bottom: 1px solid white;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #f0f0f0;
-        }
-        
-        QPushButton {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #f8f8f8;
-            border-color: #999999;
-        }
-        
-        QPushButton:pressed {
-            background-color: #e8e8e8;
-        }
-        
-        QPushButton:disabled {
-            background-color: #f0f0f0;
-            color: #999999;
-            border-color: #dddddd;
-        }
-        
-        QSlider::groove:horizontal {
-            border: 1px solid #cccccc;
-            height: 6px;
-            background: #f0f0f0;
-            border-radius: 3px;
-        }
-        
-        QSlider::handle:horizontal {
-            background: #4a90e2;
-            border: 1px solid #3a7bc8;
-            width: 16px;
-            height: 16px;
-            border-radius: 8px;
-            margin: -6px 0;
-        }
-        
-        QProgressBar {
-            border: 1px solid #cccccc;
-            border-radius: 4px;
-            text-align: center;
-            background-color: #f0f0f0;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #4a90e2;
-            border-radius: 3px;
-        }
-        """
-        
-        self.setStyleSheet(style)
+        self.setStyleSheet(_STYLE_SHEET)
     
     def _generate_scramble(self) -> None:
         """Generate a new scramble."""
@@ -352,7 +564,8 @@ class MainWindow(QMainWindow):
             scrambled_state = scramble.apply_to(CubeState.solved())
             
             self.cube_state = scrambled_state
-            self.renderer_3d.set_state(self.cube_state)
+            self._invalidate_facelets()
+            self._schedule_render(self.cube_state)
             self.color_input_panel.set_cube_state(self.cube_state)
             
             self.status_label.setText(f"Generated scramble: {scramble}")
@@ -361,39 +574,74 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", f"Failed to generate scramble: {str(e)}")
     
     def _solve_cube(self) -> None:
-        """Solve the current cube state."""
+        """Solve the current cube state in the background."""
         if self.cube_state.is_solved():
             QMessageBox.information(self, "Info", "Cube is already solved!")
             return
         
+        if self._solve_worker is not None:
+            self.status_label.setText("Still solving - please wait")
+            return
+        
+        # Solve the state as it is now, even if it is edited while solving;
+        # the solvers are looked up here so they are created on this thread
+        state = self.cube_state
+        scheme = self.color_scheme
+        if self.current_solver == "Fast":
+            solve = partial(self.fast_solver.solve, state, scheme)
+        elif self.current_solver == "Tutor":
+            tutor_solver = self.tutor_solver
+            
+            def solve() -> MoveSequence:
+                # The window plays the complete solution; the steps' titles and
+                # explanations have no panel to show them in
+                _, solution = tutor_solver.solve(state, scheme)
+                return solution
+        elif self.current_solver == "Research":
+            solve = partial(self.research_solver.solve, state)
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to solve cube: Unknown solver: {self.current_solver}")
+            self.status_label.setText("Solve failed")
+            return
+        
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.status_label.setText("Solving cube...")
         
+        # The solver runs off the GUI thread, so the window stays responsive
+        # and the progress bar animates; the result comes back as a signal
+        self._solve_worker = _SolveWorker(solve, state, self.current_solver)
+        self._solve_worker.signals.finished.connect(self._on_solve_finished)
+        self._solve_worker.signals.failed.connect(self._on_solve_failed)
+        QThreadPool.globalInstance().start(self._solve_worker)
+    
+    def _on_solve_finished(self, solution: MoveSequence) -> None:
+        """Show the solution of the background solve."""
+        worker = self._solve_worker
+        self._solve_worker = None
+        self.progress_bar.setVisible(False)
+        
+        # Fill the solution and stats tabs with one layout and repaint pass
+        self.control_tabs.setUpdatesEnabled(False)
         try:
-            if self.current_solver == "Fast":
-                solution = self.fast_solver.solve(self.cube_state, self.color_scheme)
-            elif self.current_solver == "Tutor":
-                steps, solution = self.tutor_solver.solve(self.cube_state, self.color_scheme)
-                # TODO: Handle tutorial steps
-            elif self.current_solver == "Research":
-                solution = self.research_solver.solve(self.cube_state)
-            else:
-                raise ValueError(f"Unknown solver: {self.current_solver}")
-            
             self.current_solution = solution
-            self.animation_controller.load_sequence(solution, self.cube_state)
+            self.animation_controller.load_sequence(solution, worker.state)
             self.solution_list.set_solution(solution)
-            self.stats_panel.update_stats(solution, self.current_solver)
+            self.stats_panel.update_stats(solution, worker.solver_name)
             
             self.status_label.setText(f"Solution found: {len(solution)} moves")
             
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to solve cube: {str(e)}")
-            self.status_label.setText("Solve failed")
-        
+            self._on_solve_failed(str(e))
         finally:
-            self.progress_bar.setVisible(False)
+            self.control_tabs.setUpdatesEnabled(True)
+    
+    def _on_solve_failed(self, message: str) -> None:
+        """Report a failed background solve."""
+        self._solve_worker = None
+        self.progress_bar.setVisible(False)
+        QMessageBox.warning(self, "Error", f"Failed to solve cube: {message}")
+        self.status_label.setText("Solve failed")
     
     def _validate_cube(self) -> None:
         """Validate the current cube state."""
@@ -419,24 +667,14 @@ class MainWindow(QMainWindow):
     
     def _show_about(self) -> None:
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About Cubist",
-            """
-            <h3>Cubist v1.0.0</h3>
-            <p>3×3 Rubik's Cube Solver & Tutor</p>
-            <p>A comprehensive desktop application for solving and learning the Rubik's Cube.</p>
-            <p><b>Features:</b></p>
-            <ul>
-            <li>Fast optimal solving (Kociemba algorithm)</li>
-            <li>Step-by-step tutorial mode</li>
-            <li>Research solver with visualization</li>
-            <li>3D animation and playback controls</li>
-            <li>PDF export and statistics</li>
-            </ul>
-            <p>Built with Python, PySide6, and OpenGL.</p>
-            """
-        )
+        # Built on first use and kept for later calls
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About Cubist")
+            self._about_box.setTextFormat(Qt.RichText)
+            self._about_box.setText(_ABOUT_HTML)
+            self._about_box.setIconPixmap(self.windowIcon().pixmap(64, 64))
+        self._about_box.exec()
     
     def _on_solver_changed(self, solver_name: str) -> None:
         """Handle solver selection change."""
@@ -446,23 +684,42 @@ class MainWindow(QMainWindow):
     def _on_cube_state_changed(self, state: CubeState) -> None:
         """Handle cube state change from input panel."""
         self.cube_state = state
-        self.renderer_3d.set_state(state)
+        self._invalidate_facelets()
+        self._schedule_render(state)
         self.status_label.setText("Cube state updated")
     
     def _on_animation_progress(self, progress: float, current: int, total: int) -> None:
         """Handle animation progress update."""
+        # Show at most one update per _PROGRESS_INTERVAL, but always the last one
+        now = time.monotonic()
+        if current < total and now - self._last_progress_time < _PROGRESS_INTERVAL:
+            return
+        self._last_progress_time = now
+        
         if total > 0:
             self.status_label.setText(f"Playing: {current}/{total} ({progress*100:.0f}%)")
     
-    def _on_step_changed(self, step: int) -> None:
+    def _on_step_changed(self, step: int, state: CubeState) -> None:
         """Handle animation step change."""
-        # Update 3D renderer with current state
-        current_state = self.animation_controller.get_current_state()
-        self.renderer_3d.set_state(current_state)
+        # Update 3D renderer with the state the controller precomputed for this step
+        self._schedule_render(state)
         
         # Highlight current move in solution list
         self.solution_list.highlight_step(step)
     
+    def _schedule_render(self, state: CubeState) -> None:
+        """Show state in the 3D view at the end of this frame, replacing any state still waiting."""
+        self._pending_render_state = state
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+    
+    def _flush_render(self) -> None:
+        """Hand the latest scheduled state to the 3D renderer."""
+        state = self._pending_render_state
+        self._pending_render_state = None
+        if state is not None:
+            self.renderer_3d.set_state(state)
+    
     def _on_playback_finished(self) -> None:
         """Handle playback completion."""
         self.status_label.setText("Playback finished - Cube solved!")
@@ -478,93 +735,69 @@ class MainWindow(QMainWindow):
         # Get facelet indices for the clicked piece
         facelet_indices = self._get_facelet_indices_for_piece(piece_id)
         
-        # Convert current cube state to facelets
-        facelets = self.cube_state.to_facelets(self.color_input_panel.color_scheme)
-        
         # Update the facelets with the selected color for each facelet
+        facelets = self._get_facelets()
         for facelet_index in facelet_indices:
             facelets[facelet_index] = current_color
         
-        # Update the cube state from the modified facelets
+        # Apply the edits at the end of this frame; clicks until then join in
+        self._pending_piece_id = piece_id
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _get_facelets(self) -> List[str]:
+        """Return the cached facelets of the cube, converting the state only when it changed."""
+        if self._facelet_cache is None:
+            self._facelet_cache = self.cube_state.to_facelets(self.color_input_panel.color_scheme)
+        return self._facelet_cache
+    
+    def _invalidate_facelets(self) -> None:
+        """Drop the cached facelets after the cube state or color scheme changes."""
+        self._facelet_cache = None
+    
+    def _flush_facelet_edits(self) -> None:
+        """Apply the facelets painted since the last flush to the cube state."""
+        facelets = self._facelet_cache
+        if facelets is None:
+            return
+        
+        # Update the cube state from the modified facelets; an invalid
+        # paint keeps its facelets cached, so later clicks build on them
+        self.control_tabs.setUpdatesEnabled(False)
         try:
             self.cube_state = CubeState.from_facelets(facelets)
+            self._invalidate_facelets()
             # Update the 3D renderer with the new state
-            self.renderer_3d.set_state(self.cube_state)
+            self._schedule_render(self.cube_state)
             
             # Update the color input panel to reflect changes
             self.color_input_panel.update_facelets(facelets)
             
             # Update status
-            self.status_label.setText(f"Status: Painted piece {piece_id} with color {current_color}")
+            current_color = self.color_input_panel.current_color
+            self.status_label.setText(
+                f"Status: Painted piece {self._pending_piece_id} with color {current_color}")
         except ValueError as e:
             # Handle invalid cube state
             print(f"Error updating cube state: {e}")
             self.status_label.setText(f"Error: Invalid cube state - {e}")
+        finally:
+            self.control_tabs.setUpdatesEnabled(True)
     
     def _get_facelet_indices_for_piece(self, piece_id: int) -> List[int]:
         """Get the facelet indices for a given piece ID based on cube geometry with improved accuracy."""
         # Validate piece_id input
         if not isinstance(piece_id, int) or piece_id < 0 or piece_id > 26:
             return []
-            
-        # Mapping of cubie positions to facelet indices
-        # The 3D renderer creates cubies in a specific order:
-        # x: -1, 0, 1; y: -1, 0, 1; z: -1, 0, 1 (center cubie skipped)
-        # This gives us 26 cubies with IDs 0-26
-        
-        # Define facelet indices for each cubie based on position
-        # Format: [cubie_id] = [list of facelet indices]
-        # Using standard cube notation:
-        # U: Up, D: Down, L: Left, R: Right, F: Front, B: Back
-        # Facelet indices: 0-8 (U), 9-17 (L), 18-26 (F), 27-35 (R), 36-44 (B), 45-53 (D)
-        cubie_to_facelets = {
-            # Back layer (z = -1)
-            0: [0, 36, 9],   # UBL corner: U7, B9, L1
-            1: [1, 37],      # UB edge: U8, B8
-            2: [2, 38, 27],  # UBR corner: U9, B7, R1
-            3: [3, 39],      # LB edge: L4, B6
-            4: [4],          # L center: L5
-            5: [5, 41],      # RB edge: R2, B4
-            6: [6, 42, 15],  # DBL corner: D1, B3, L7
-            7: [7, 43],      # DB edge: D2, B2
-            8: [8, 44, 33],  # DBR corner: D3, B1, R3
-            
-            # Middle layer (z = 0)
-            9: [10, 36],     # UL edge: U4, L1
-            10: [13],        # L center: L5
-            11: [16, 27],    # UR edge: U6, R1
-            12: [37],        # L center: L2
-            13: [],          # Center cubie (skipped)
-            14: [41],        # R center: R2
-            15: [28, 42],    # DL edge: D4, L7
-            16: [31],        # D center: D5
-            17: [34, 33],    # DR edge: D6, R3
-            
-            # Front layer (z = 1)
-            18: [18, 9, 29], # UFL corner: F7, L3, U1
-            19: [19, 12],    # UF edge: F4, U2
-            20: [20, 27, 29], # UFR corner: F1, R1, U3
-            21: [21, 39],    # FL edge: F6, L6
-            22: [22],        # F center: F5
-            23: [23, 41],    # FR edge: F2, R2
-            24: [24, 15, 45], # DFL corner: F9, L9, D7
-            25: [25, 43],    # DF edge: F8, D8
-            26: [26, 33, 47], # DFR corner: F3, R3, D9
-        }
-        
-        # Validate and return facelet indices for the given piece ID
-        if piece_id in cubie_to_facelets:
-            # Filter out any invalid facelet indices
-            valid_indices = [idx for idx in cubie_to_facelets[piece_id] if 0 <= idx < 54]
-            return valid_indices
-        else:
-            return []
+        
+        return list(_PIECE_FACELETS[piece_id])
     
     def closeEvent(self, event) -> None:
         """Handle window close event."""
-        # Stop any ongoing animations or solving
+        # Stop any ongoing animations or solving (a solver that was never
+        # created has nothing to cancel)
         self.animation_controller.stop()
-        if hasattr(self.research_solver, 'cancel'):
+        if 'research_solver' in self.__dict__:
             self.research_solver.cancel()
         
         event.accept()
@@ -17,7 +17,7 @@ class AnimationController(QObject):
     playback_paused = Signal()
     playback_stopped = Signal()
     playback_finished = Signal()
-    step_changed = Signal(int)  # current step index
+    step_changed = Signal(int, object)  # current step index, CubeState at that step
     
     def __init__(self, parent=None) -> None:
         """Initialize the animation controller."""
@@ -26,7 +26,8 @@ class AnimationController(QObject):
         # Sequence and state management
         self.sequence = MoveSequence([])
         self.initial_state = CubeState.solved()
-        self.state_history: List[CubeState] = []
+        # State after each step; holds the initial state until a sequence is loaded
+        self.state_history: List[CubeState] = [self.initial_state]
         
         # Playback state
         self.current_step = 0
@@ -121,7 +122,7 @@ class AnimationController(QObject):
         # Validate we can move forward
         if self.current_step < len(self.sequence):
             self.current_step += 1
-            self.step_changed.emit(self.current_step)
+            self._emit_step()
             self._emit_progress()
             
             # Handle reaching the end
@@ -136,7 +137,7 @@ class AnimationController(QObject):
         # Validate we can move backward
         if self.current_step > 0:
             self.current_step -= 1
-            self.step_changed.emit(self.current_step)
+            self._emit_step()
             self._emit_progress()
         
         # Ensure we don't go before the beginning
@@ -160,7 +161,7 @@ class AnimationController(QObject):
         self.current_step = step_index
         
         # Emit signals for UI updates
-        self.step_changed.emit(self.current_step)
+        self._emit_step()
         self._emit_progress()
         
         # Handle playback state when seeking
@@ -256,6 +257,10 @@ class AnimationController(QObject):
         self.playback_finished.emit()
         self._emit_progress()
     
+    def _emit_step(self) -> None:
+        """Emit step_changed with the precomputed state of the current step."""
+        self.step_changed.emit(self.current_step, self.state_history[self.current_step])
+    
     def _emit_progress(self) -> None:
         """Emit progress signals."""
         progress = self.get_progress()
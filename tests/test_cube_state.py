@@ -69,6 +69,29 @@ class TestCubeState:
         # Should be usable in sets
         state_set = {state1, state2, state3}
         assert len(state_set) == 2  # state1 and state2 are equal
+        
+        # Byte keys follow equality too
+        assert state1.to_bytes() == state2.to_bytes()
+        assert state1.to_bytes() != state3.to_bytes()
+    
+    def test_cube_state_packing(self):
+        """Test packing a cube state into an integer and back."""
+        from cubist.core.moves import MoveSequence
+        
+        state = MoveSequence.parse("R U F' L2 D B R' U2").apply_to(CubeState.solved())
+        packed = state.pack()
+        
+        # Packed form fits in 100 bits and round-trips
+        assert packed.bit_length() <= 100
+        assert CubeState.from_packed(packed) == state
+        
+        # Different states pack differently
+        assert CubeState.solved().pack() != packed
+        
+        # Raw bytes round-trip too
+        assert CubeState.from_bytes(state.to_bytes()) == state
+        with pytest.raises(ValueError):
+            CubeState.from_bytes(b"\x00" * 39)
     
     def test_facelet_conversion_solved(self):
         """Test facelet conversion for solved state."""
@@ -102,6 +125,17 @@ class TestCubeState:
         
         assert original_state == converted_state
     
+    def test_face_string_matches_facelets(self):
+        """Test that the face letter string names each sticker's face."""
+        from cubist.core.moves import MoveSequence
+        
+        state = MoveSequence.parse("R U F' L2 D B").apply_to(CubeState.solved())
+        scheme = ColorScheme()
+        letters = dict(zip((scheme.U, scheme.R, scheme.F, scheme.D, scheme.L, scheme.B), "URFDLB"))
+        
+        assert CubeState.solved().to_face_string() == "".join(face * 9 for face in "URFDLB")
+        assert state.to_face_string() == "".join(letters[color] for color in state.to_facelets(scheme))
+    
     def test_move_application_r(self):
         """Test applying R move to solved state."""
         state = CubeState.solved()
@@ -148,6 +182,18 @@ class TestCubeState:
         
         assert current.is_solved()
     
+    def test_face_turns_move_twelve_stickers(self):
+        """Test that every face turn moves 12 stickers and keeps its face one color."""
+        from cubist.core.moves import MoveSequence
+        
+        solved = CubeState.solved().to_face_string()
+        for index, face in enumerate("URFDLB"):
+            for suffix in ("", "'", "2"):
+                turned = MoveSequence.parse(face + suffix).apply_to(CubeState.solved()).to_face_string()
+                
+                assert sum(a != b for a, b in zip(turned, solved)) == 12
+                assert turned[index * 9:index * 9 + 9] == face * 9
+    
     def test_move_inverse_property(self):
         """Test that move and its inverse cancel out."""
         state = CubeState.solved()
@@ -181,6 +227,17 @@ class TestCubeState:
         after_u_u = state.apply_move(Move.U).apply_move(Move.U)
         assert after_u2 == after_u_u
     
+    def test_apply_sequence_matches_single_moves(self):
+        """Test that apply_sequence equals applying the moves one by one."""
+        moves = [Move.R, Move.U, Move.Fp, Move.L2, Move.D, Move.Bp, Move.r, Move.U2]
+        
+        expected = CubeState.solved()
+        for move in moves:
+            expected = expected.apply_move(move)
+        
+        assert CubeState.solved().apply_sequence(moves) == expected
+        assert CubeState.solved().apply_sequence([]) == CubeState.solved()
+    
     def test_scramble_and_solve(self):
         """Test scrambling and solving back."""
         from cubist.core.moves import MoveSequence
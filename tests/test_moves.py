@@ -19,6 +19,20 @@ class TestMove:
         assert str(Move.Up) == "U'"
         assert str(Move.U2) == "U2"
     
+    def test_move_properties(self):
+        """Test the notation, code, face and turn of moves."""
+        from cubist.core.moves import move_codes
+        
+        assert Move.Rp.notation == "R'"
+        assert (Move.R.code, Move.Rp.code, Move.b2.code) == (0, 1, 35)
+        assert (Move.U2.face, Move.u.face) == ("U", "u")
+        assert (Move.L.face_id, Move.f.face_id) == (1, 10)
+        assert (Move.D.turn, Move.Dp.turn, Move.D2.turn) == (1, -1, 2)
+        assert move_codes([Move.R, Move.Up, Move.b2]) == bytes([0, 7, 35])
+        
+        with pytest.raises(AttributeError):
+            Move.R.code = 5
+    
     def test_move_parsing(self):
         """Test parsing moves from strings."""
         assert Move.from_string("R") == Move.R
@@ -170,6 +184,16 @@ class TestMoveSequence:
         simplified = seq.simplify()
         assert len(simplified) == 0
     
+    def test_sequence_simplification_long(self):
+        """Test that long sequences simplify the same as short ones."""
+        short = MoveSequence.parse("R R U U' F2 F r r' L D D D")
+        seq = MoveSequence(short.moves * 20)
+        
+        # Each repetition ends on D and starts on R, so runs never span two
+        assert len(seq) >= 100
+        assert str(short.simplify()) == "R2 F' L D'"
+        assert str(seq.simplify()) == " ".join(["R2 F' L D'"] * 20)
+    
     def test_sequence_application_to_cube(self):
         """Test applying sequence to cube state."""
         state = CubeState.solved()
@@ -214,6 +238,17 @@ class TestMoveSequence:
         assert seq1 != seq3
         assert seq2 != seq3
     
+    def test_sequence_hashing(self):
+        """Test that sequences are unhashable but their move tuples hash by value."""
+        seq1 = MoveSequence.parse("R U R' U'")
+        seq2 = MoveSequence([Move.R, Move.U, Move.Rp, Move.Up])
+        seq3 = MoveSequence.parse("R U R'")
+        
+        # append/extend change a sequence, so it can't be a set member or dict key
+        with pytest.raises(TypeError):
+            hash(seq1)
+        assert len({seq1.moves, seq2.moves, seq3.moves}) == 2
+    
     def test_sequence_indexing(self):
         """Test sequence indexing."""
         seq = MoveSequence.parse("R U R' U'")
@@ -0,0 +1,98 @@
+"""
+Unit tests for the IDA* research solver.
+"""
+
+import pytest
+from cubist.core.cube_state import CubeState
+from cubist.core.moves import MoveSequence
+from cubist.solvers.research_ida import IDAStarSolver
+
+
+# Faces of each axis, in the order the search allows opposite faces to follow each other
+_AXIS_ORDER = {"R": (0, 0), "L": (0, 1), "U": (1, 0), "D": (1, 1), "F": (2, 0), "B": (2, 1)}
+
+
+class TestIDAStarSolver:
+    """Test cases for IDAStarSolver's move pruning."""
+    
+    def test_successors_skip_redundant_moves(self):
+        """Test that no move follows one on its own face or a later opposite face."""
+        solver = IDAStarSolver()
+        
+        for prev, row in enumerate(solver._successors[:-1]):
+            prev_axis, prev_order = _AXIS_ORDER[solver.moves[prev].face]
+            for entry in row:
+                axis, order = _AXIS_ORDER[entry[1].face]
+                assert axis != prev_axis or order > prev_order
+        
+        # Any move may start a search
+        assert [entry[1] for entry in solver._successors[-1]] == solver.moves
+    
+    def test_canonical_sequence_counts(self):
+        """Test that the search generates each canonical sequence once, up to depth 8."""
+        solver = IDAStarSolver()
+        no_move = len(solver.moves)
+        
+        # Number of sequences ending in each move, counted through the successor table
+        counts = [0] * no_move + [1]
+        totals = []
+        for _ in range(8):
+            next_counts = [0] * (no_move + 1)
+            for prev, row in enumerate(solver._successors):
+                for entry in row:
+                    next_counts[entry[0]] += counts[prev]
+            counts = next_counts
+            totals.append(sum(counts))
+        
+        # Known counts of canonical face turn sequences of length 1-8
+        assert totals == [18, 243, 3240, 43254, 577368, 7706988, 102876480, 1373243544]
+    
+    def test_short_paths_never_revisit_a_state(self):
+        """Test that no path of up to 4 moves returns to a state already on it."""
+        solver = IDAStarSolver()
+        start = MoveSequence.parse("R U F' L2").apply_to(CubeState.solved())
+        
+        def walk(state, last, on_path, depth):
+            for index, move, *_ in solver._successors[last]:
+                child = state.apply_move(move)
+                key = child.to_bytes()
+                assert key not in on_path
+                if depth > 1:
+                    walk(child, index, on_path | {key}, depth - 1)
+        
+        walk(start, len(solver.moves), {start.to_bytes()}, 4)
+    
+    def test_heuristic_never_overestimates(self):
+        """Test that the heuristic is at most the distance of every state up to 4 moves away."""
+        solver = IDAStarSolver()
+        solved = CubeState.solved()
+        seen = {solved.to_bytes()}
+        frontier = [solved]
+        
+        assert solver._heuristic(solved) == 0
+        for depth in range(1, 5):
+            next_frontier = []
+            for state in frontier:
+                for move in solver.moves:
+                    child = state.apply_move(move)
+                    key = child.to_bytes()
+                    if key not in seen:
+                        seen.add(key)
+                        next_frontier.append(child)
+                        assert 1 <= solver._heuristic(child) <= depth
+            frontier = next_frontier
+    
+    def test_solves_short_scramble(self):
+        """Test that a short scramble is solved in at most as many moves."""
+        solver = IDAStarSolver()
+        solver.corner_pdb_path = None
+        scramble = MoveSequence.parse("R U F' L2")
+        
+        solution = solver.solve(scramble.apply_to(CubeState.solved()))
+        
+        assert len(solution.moves) <= len(scramble.moves)
+        assert solution.apply_to(scramble.apply_to(CubeState.solved())).is_solved()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,49 @@
+"""
+Unit tests for the layer-by-layer tutor solver.
+"""
+
+import pytest
+from cubist.core.cube_state import CubeState
+from cubist.core.moves import Move, MoveSequence
+from cubist.solvers.tutor_lbl import TutorSolver, plan_steps
+
+
+class TestPlanSteps:
+    """Test cases for plan_steps."""
+    
+    def test_results_are_independent_copies(self):
+        """Test that changing one plan does not change the next plan of the same state."""
+        state = MoveSequence.parse("R U F' L2 D B").apply_to(CubeState.solved())
+        steps, solution = plan_steps(state)
+        expected_steps = [(step.title, str(step.moves), list(step.highlight_pieces)) for step in steps]
+        expected_solution = str(solution)
+        
+        solution.append(Move.U)
+        steps[0].title = "Changed"
+        steps[0].moves.append(Move.U)
+        steps[0].highlight_pieces.append(99)
+        steps.pop()
+        
+        steps, solution = plan_steps(state)
+        assert [(step.title, str(step.moves), step.highlight_pieces) for step in steps] == expected_steps
+        assert str(solution) == expected_solution
+
+
+class TestTutorSolver:
+    """Test cases for TutorSolver."""
+    
+    def test_steps_do_not_share_algorithms(self):
+        """Test that changing a step's moves leaves the solver's algorithms intact."""
+        solver = TutorSolver()
+        state = MoveSequence.parse("R U F' L2 D B").apply_to(CubeState.solved())
+        expected = {name: str(sequence) for name, sequence in TutorSolver.algorithms.items()}
+        
+        steps, _ = solver.solve(state)
+        for step in steps:
+            step.moves.append(Move.U)
+        
+        assert {name: str(sequence) for name, sequence in TutorSolver.algorithms.items()} == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])